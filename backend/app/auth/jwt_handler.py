@@ -1,12 +1,16 @@
 """
 JWT token handling for session management.
 
-Uses python-jose for JWT creation and verification.
+Uses PyJWT for JWT creation and verification.
 """
 import logging
-from datetime import datetime, timedelta, timezone
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
 from typing import Optional
-from jose import jwt, JWTError
+import jwt
+from jwt.exceptions import InvalidTokenError, PyJWTError
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -14,6 +18,23 @@ logger = logging.getLogger(__name__)
 # JWT algorithm
 ALGORITHM = "HS256"
 
+# Default access token lifetime in seconds
+_ACCESS_TTL_S = settings.JWT_EXPIRATION_HOURS * 3600
+
+# Verified access tokens, keyed by raw token string. Entries are dropped at
+# the token's own exp or after _DECODE_CACHE_TTL_S, whichever comes first,
+# which bounds how long a revoked token or rotated secret stays accepted.
+_DECODE_CACHE_MAX_SIZE = 10_000
+_DECODE_CACHE_TTL_S = 60
+_decode_cache: "OrderedDict[str, tuple[dict, float]]" = OrderedDict()
+_decode_cache_lock = threading.Lock()
+
+
+def clear_access_token_cache() -> None:
+    """Drop all cached access token verifications (e.g. after logout or key rotation)."""
+    with _decode_cache_lock:
+        _decode_cache.clear()
+
 
 def create_access_token(email: str, workspace_id: str, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -33,21 +54,23 @@ def create_access_token(email: str, workspace_id: str, expires_delta: Optional[t
     if not settings.JWT_SECRET_KEY:
         raise ValueError("JWT_SECRET_KEY not configured")
 
-    if expires_delta is None:
-        expires_delta = timedelta(hours=settings.JWT_EXPIRATION_HOURS)
+    ttl_seconds = _ACCESS_TTL_S if expires_delta is None else int(expires_delta.total_seconds())
 
-    expire = datetime.now(timezone.utc) + expires_delta
+    # One clock read per token; epoch seconds skip datetime conversion in PyJWT
+    now = int(time.time())
+    expire = now + ttl_seconds
 
     payload = {
         "sub": email,
         "workspace_id": workspace_id,
         "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "iat": now,
         "type": "access"
     }
 
     token = jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=ALGORITHM)
-    logger.debug(f"Created access token for {email}, expires {expire}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Created access token for %s, expires %s", email, expire)
     return token
 
 
@@ -55,6 +78,9 @@ def decode_access_token(token: str) -> Optional[dict]:
     """
     Decode and verify a JWT access token.
 
+    Repeat verifications of the same token are served from an in-process
+    LRU cache, skipping the HMAC check and JSON parse.
+
     Args:
         token: JWT token string
 
@@ -66,15 +92,34 @@ def decode_access_token(token: str) -> Optional[dict]:
         logger.error("JWT_SECRET_KEY not configured")
         return None
 
+    now = time.time()
+    with _decode_cache_lock:
+        cached = _decode_cache.get(token)
+        if cached is not None:
+            payload, valid_until = cached
+            if now < valid_until:
+                _decode_cache.move_to_end(token)
+                return dict(payload)
+            del _decode_cache[token]
+
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(
+            token,
+            settings.JWT_SECRET_KEY,
+            algorithms=[ALGORITHM],
+            options={"require": ["exp", "iat", "sub", "type"]}
+        )
 
         # Verify this is an access token
-        if payload.get("type") != "access":
-            logger.warning("Token is not an access token")
-            return None
+        if payload["type"] != "access":
+            raise InvalidTokenError("Token is not an access token")
+
+        with _decode_cache_lock:
+            _decode_cache[token] = (payload, min(payload["exp"], now + _DECODE_CACHE_TTL_S))
+            if len(_decode_cache) > _DECODE_CACHE_MAX_SIZE:
+                _decode_cache.popitem(last=False)
 
-        return payload
-    except JWTError as e:
-        logger.warning(f"JWT decode error: {e}")
+        return dict(payload)
+    except PyJWTError as e:
+        logger.warning("JWT decode error: %s", e)
         return None
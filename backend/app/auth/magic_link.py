@@ -3,20 +3,80 @@ Magic link authentication.
 
 Generates time-limited tokens sent via email for passwordless login.
 """
+import asyncio
 import logging
-import secrets
-from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple
-from jose import jwt, JWTError
-import resend
+import time
+from contextlib import asynccontextmanager
+from string import Template
+from typing import AsyncIterator, List, Optional, Tuple
+import httpx
+import jwt
+from jwt.exceptions import InvalidTokenError, PyJWTError
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 # Magic link tokens expire in 15 minutes
 MAGIC_LINK_EXPIRATION_MINUTES = 15
+_MAGIC_TTL_S = MAGIC_LINK_EXPIRATION_MINUTES * 60
 ALGORITHM = "HS256"
 
+# Resend REST API
+RESEND_API_URL = "https://api.resend.com"
+RESEND_BATCH_SIZE = 100  # Max emails per /emails/batch request
+RESEND_REQUESTS_PER_SECOND = 2  # Default Resend API rate limit
+RESEND_KEEPALIVE_SECONDS = 60.0  # Idle time before a pooled connection is dropped
+
+# Pooled Resend client, opened and closed by the app lifespan
+_resend_client: Optional[httpx.AsyncClient] = None
+
+# Email templates, parsed once at import with the expiry baked in
+_HTML_TEMPLATE = Template(Template("""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <style>
+            body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }
+            .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+            .button {
+                display: inline-block;
+                background-color: #10b981;
+                color: white;
+                padding: 12px 24px;
+                text-decoration: none;
+                border-radius: 6px;
+                font-weight: 500;
+            }
+            .footer { margin-top: 30px; color: #6b7280; font-size: 14px; }
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <h2>Sign in to Meal Planner</h2>
+            <p>Click the button below to sign in. This link expires in $minutes minutes.</p>
+            <p style="margin: 30px 0;">
+                <a href="$url" class="button">Sign In</a>
+            </p>
+            <p class="footer">
+                If you didn't request this email, you can safely ignore it.<br>
+                This link can only be used once.
+            </p>
+        </div>
+    </body>
+    </html>
+    """).safe_substitute(minutes=MAGIC_LINK_EXPIRATION_MINUTES))
+
+# Plain text fallback
+_TEXT_TEMPLATE = Template(Template("""
+Sign in to Meal Planner
+
+Click the link below to sign in (expires in $minutes minutes):
+
+$url
+
+If you didn't request this email, you can safely ignore it.
+    """).safe_substitute(minutes=MAGIC_LINK_EXPIRATION_MINUTES))
+
 
 def create_magic_link_token(email: str) -> str:
     """
@@ -34,21 +94,19 @@ def create_magic_link_token(email: str) -> str:
     if not settings.JWT_SECRET_KEY:
         raise ValueError("JWT_SECRET_KEY not configured")
 
-    expire = datetime.now(timezone.utc) + timedelta(minutes=MAGIC_LINK_EXPIRATION_MINUTES)
-
-    # Add a random nonce for extra security
-    nonce = secrets.token_urlsafe(16)
+    # iat and exp share one epoch-seconds timestamp
+    now = int(time.time())
+    expire = now + _MAGIC_TTL_S
 
     payload = {
         "sub": email,
         "exp": expire,
-        "iat": datetime.now(timezone.utc),
-        "type": "magic_link",
-        "nonce": nonce
+        "iat": now,
+        "type": "magic_link"
     }
 
     token = jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=ALGORITHM)
-    logger.info(f"Created magic link token for {email}, expires in {MAGIC_LINK_EXPIRATION_MINUTES} minutes")
+    logger.info("Created magic link token for %s, expires in %s minutes", email, MAGIC_LINK_EXPIRATION_MINUTES)
     return token
 
 
@@ -67,30 +125,104 @@ def verify_magic_link_token(token: str) -> Optional[str]:
         return None
 
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(
+            token,
+            settings.JWT_SECRET_KEY,
+            algorithms=[ALGORITHM],
+            options={"require": ["exp", "iat", "sub", "type"]}
+        )
 
         # Verify this is a magic link token
-        if payload.get("type") != "magic_link":
-            logger.warning("Token is not a magic link token")
-            return None
+        if payload["type"] != "magic_link":
+            raise InvalidTokenError("Token is not a magic link token")
 
-        email = payload.get("sub")
+        email = payload["sub"]
         if not email:
-            logger.warning("Magic link token missing email")
-            return None
+            raise InvalidTokenError("Magic link token missing email")
 
-        logger.info(f"Magic link token verified for {email}")
+        logger.info("Magic link token verified for %s", email)
         return email
 
-    except JWTError as e:
-        logger.warning(f"Magic link token verification failed: {e}")
+    except PyJWTError as e:
+        logger.warning("Magic link token verification failed: %s", e)
         return None
 
 
-def send_magic_link_email(email: str, magic_link_url: str) -> Tuple[bool, Optional[str]]:
+def _new_resend_client(api_key: str) -> httpx.AsyncClient:
+    """
+    Create an HTTP client authorized against the Resend API.
+
+    Idle connections are kept longer than httpx's 5s default because
+    sign-in emails are sporadic, so follow-up sends on a pooled client
+    usually skip the TLS handshake.
+
+    Args:
+        api_key: Resend API key
+
+    Returns:
+        httpx.AsyncClient bound to the Resend API
+    """
+    return httpx.AsyncClient(
+        base_url=RESEND_API_URL,
+        headers={"Authorization": f"Bearer {api_key}"},
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=5, keepalive_expiry=RESEND_KEEPALIVE_SECONDS),
+    )
+
+
+async def open_resend_client() -> None:
+    """
+    Open the pooled Resend client shared by sends during the app's lifespan.
+
+    Called from the FastAPI lifespan, so the client belongs to the event
+    loop serving requests. Does nothing if RESEND_API_KEY is not set.
+    """
+    global _resend_client
+    if settings.RESEND_API_KEY and _resend_client is None:
+        _resend_client = _new_resend_client(settings.RESEND_API_KEY)
+
+
+async def close_resend_client() -> None:
+    """Close the pooled Resend client opened by open_resend_client."""
+    global _resend_client
+    if _resend_client is not None:
+        await _resend_client.aclose()
+        _resend_client = None
+
+
+@asynccontextmanager
+async def _resend_session(api_key: str) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Yield the app's pooled Resend client, or one scoped to this call.
+
+    Outside the app lifespan (scripts, tests) there is no pooled client,
+    and a client cached across calls would stay bound to the first event
+    loop that used it, so a fresh client is opened and closed instead.
+    """
+    if _resend_client is not None:
+        yield _resend_client
+        return
+    async with _new_resend_client(api_key) as client:
+        yield client
+
+
+def _build_magic_link_email(email: str, magic_link_url: str) -> dict:
+    """Build the Resend request body for a single magic link email."""
+    return {
+        "from": "Meal Planner <noreply@resend.dev>",  # Use verified domain in production
+        "to": [email],
+        "subject": "Sign in to Meal Planner",
+        "html": _HTML_TEMPLATE.substitute(url=magic_link_url),
+        "text": _TEXT_TEMPLATE.substitute(url=magic_link_url)
+    }
+
+
+async def send_magic_link_email(email: str, magic_link_url: str) -> Tuple[bool, Optional[str]]:
     """
     Send magic link email via Resend.
 
+    Posts to the Resend REST API without blocking the event loop.
+
     Args:
         email: Recipient email address
         magic_link_url: Full URL with magic link token
@@ -102,68 +234,67 @@ def send_magic_link_email(email: str, magic_link_url: str) -> Tuple[bool, Option
         logger.warning("RESEND_API_KEY not configured, cannot send email")
         return False, "Email service not configured"
 
-    resend.api_key = settings.RESEND_API_KEY
-
     try:
-        # Email HTML template
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .button {{
-                    display: inline-block;
-                    background-color: #10b981;
-                    color: white;
-                    padding: 12px 24px;
-                    text-decoration: none;
-                    border-radius: 6px;
-                    font-weight: 500;
-                }}
-                .footer {{ margin-top: 30px; color: #6b7280; font-size: 14px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h2>Sign in to Meal Planner</h2>
-                <p>Click the button below to sign in. This link expires in {MAGIC_LINK_EXPIRATION_MINUTES} minutes.</p>
-                <p style="margin: 30px 0;">
-                    <a href="{magic_link_url}" class="button">Sign In</a>
-                </p>
-                <p class="footer">
-                    If you didn't request this email, you can safely ignore it.<br>
-                    This link can only be used once.
-                </p>
-            </div>
-        </body>
-        </html>
-        """
-
-        # Plain text fallback
-        text_content = f"""
-Sign in to Meal Planner
-
-Click the link below to sign in (expires in {MAGIC_LINK_EXPIRATION_MINUTES} minutes):
-
-{magic_link_url}
-
-If you didn't request this email, you can safely ignore it.
-        """
+        async with _resend_session(settings.RESEND_API_KEY) as client:
+            response = await client.post("/emails", json=_build_magic_link_email(email, magic_link_url))
+        response.raise_for_status()
+        result = response.json()
 
-        result = resend.Emails.send({
-            "from": "Meal Planner <noreply@resend.dev>",  # Use verified domain in production
-            "to": [email],
-            "subject": "Sign in to Meal Planner",
-            "html": html_content,
-            "text": text_content
-        })
-
-        logger.info(f"Magic link email sent to {email}, id: {result.get('id')}")
+        logger.info("Magic link email sent to %s, id: %s", email, result.get('id'))
         return True, None
 
     except Exception as e:
         error_msg = str(e)
-        logger.error(f"Failed to send magic link email to {email}: {error_msg}")
+        logger.error("Failed to send magic link email to %s: %s", email, error_msg)
         return False, error_msg
+
+
+async def send_magic_link_emails_batch(recipients: List[Tuple[str, str]]) -> List[Tuple[bool, Optional[str]]]:
+    """
+    Send many magic link emails through Resend's batch endpoint.
+
+    Recipients are grouped into chunks of RESEND_BATCH_SIZE, one request per
+    chunk, with requests spaced to stay under RESEND_REQUESTS_PER_SECOND.
+    A failed chunk marks every recipient in it as failed; other chunks
+    are still sent.
+
+    Args:
+        recipients: List of (email, magic_link_url) pairs
+
+    Returns:
+        List of (success: bool, error_message: Optional[str]) tuples,
+        in the same order as recipients
+    """
+    if not settings.RESEND_API_KEY:
+        logger.warning("RESEND_API_KEY not configured, cannot send email")
+        return [(False, "Email service not configured")] * len(recipients)
+
+    min_interval = 1.0 / RESEND_REQUESTS_PER_SECOND
+    results: List[Tuple[bool, Optional[str]]] = []
+    last_request_at = None
+
+    async with _resend_session(settings.RESEND_API_KEY) as client:
+        for start in range(0, len(recipients), RESEND_BATCH_SIZE):
+            chunk = recipients[start:start + RESEND_BATCH_SIZE]
+
+            if last_request_at is not None:
+                wait = min_interval - (time.monotonic() - last_request_at)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            last_request_at = time.monotonic()
+
+            try:
+                response = await client.post(
+                    "/emails/batch",
+                    json=[_build_magic_link_email(email, url) for email, url in chunk]
+                )
+                response.raise_for_status()
+                results.extend([(True, None)] * len(chunk))
+                logger.info("Magic link batch sent to %s recipients", len(chunk))
+
+            except Exception as e:
+                error_msg = str(e)
+                logger.error("Failed to send magic link batch of %s emails: %s", len(chunk), error_msg)
+                results.extend([(False, error_msg)] * len(chunk))
+
+    return results
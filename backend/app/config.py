@@ -1,4 +1,6 @@
 """Application configuration using Pydantic Settings"""
+from functools import cached_property
+from pathlib import Path
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -38,15 +40,31 @@ class Settings(BaseSettings):
     # Admin API protection
     ADMIN_SECRET: str = ""  # Set via ADMIN_SECRET env var to protect admin endpoints
 
+    # Magic link auth (app.auth)
+    JWT_SECRET_KEY: str = ""
+    JWT_EXPIRATION_HOURS: int = 24
+    RESEND_API_KEY: str = ""
+
+    # Local file storage (logs, legacy JSON data, Chroma)
+    DATA_DIR: str = str(Path(__file__).parent.parent / "data")
+
+    # Preload the Chroma client and embedding model at startup (needs chromadb)
+    CHROMA_WARMUP: bool = False
+
     @property
+    def chroma_persist_dir(self) -> str:
+        """Chroma persistence directory inside DATA_DIR"""
+        return str(Path(self.DATA_DIR) / "chroma_db")
+
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS_ORIGINS string into list"""
+        """Parse CORS_ORIGINS string into list (parsed once per Settings instance)"""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
-        extra = "ignore"  # Allow unused env vars like DATA_DIR
+        extra = "ignore"  # Allow unused env vars
 
 
 # Global settings instance
@@ -6,25 +6,113 @@ This module handles all interactions with the Chroma vector database:
 - Embedding recipes into vector storage
 - Querying for relevant recipes based on semantic search
 """
+import json
 import logging
+import os
+import threading
+from functools import lru_cache
 from typing import List, Dict, Optional
 import chromadb
 from chromadb.config import Settings as ChromaSettings
+from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
 from app.models.recipe import Recipe
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Chroma client singleton
+# Chroma client singleton and per-workspace collection handles
 _chroma_client: Optional[chromadb.Client] = None
-RECIPES_COLLECTION_NAME = "recipes"
+_workspace_collections: Dict[str, chromadb.Collection] = {}
+# Guards singleton creation; re-entrant because the collection getter
+# initializes the client while holding it
+_chroma_lock = threading.RLock()
+
+# Each workspace gets its own collection (and HNSW graph), named with this
+# prefix, so queries never traverse or filter out other tenants' vectors
+RECIPES_COLLECTION_PREFIX = "recipes__"
+
+# Shared collection used before recipes moved to per-workspace collections;
+# migrated and dropped the first time the client is opened
+LEGACY_RECIPES_COLLECTION_NAME = "recipes"
+
+# Documents per collection.add call when embedding recipes
+EMBED_BATCH_SIZE = 64
+
+# Extra filters matching at most this many recipes are ranked by searching
+# only those IDs, instead of post-filtering a graph-wide ANN search
+SELECTIVE_FILTER_MAX_MATCHES = 200
+
+# Recipe IDs included in a log line; the count is always logged in full
+LOG_MAX_IDS = 10
+
+# HNSW index settings applied when a recipes collection is created.
+# Cosine matches the normalized MiniLM embeddings; a higher build-time ef
+# gives better recall on small per-workspace result sets. Existing
+# collections keep the settings they were created with.
+RECIPES_COLLECTION_CONFIGURATION = {
+    "hnsw": {
+        "space": "cosine",
+        "ef_construction": 200,
+        "ef_search": 100,
+        "max_neighbors": 16,
+    }
+}
+
+
+def configure_performance_environment() -> None:
+    """
+    Set thread and telemetry environment defaults for CPU embedding.
+
+    Every uvicorn worker otherwise sizes its native thread pools to all
+    cores, oversubscribing the CPU when several workers embed at once.
+    Splits the cores across WEB_CONCURRENCY workers. Uses setdefault, so
+    values set explicitly in the environment win. Must run before the
+    embedding model is loaded to take effect.
+    """
+    try:
+        workers = max(1, int(os.environ.get("WEB_CONCURRENCY") or 1))
+    except ValueError:
+        logger.warning("Ignoring invalid WEB_CONCURRENCY=%r; assuming 1 worker", os.environ["WEB_CONCURRENCY"])
+        workers = 1
+    os.environ.setdefault("OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // workers)))
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+    os.environ.setdefault("ANONYMIZED_TELEMETRY", "False")
+
+
+@lru_cache(maxsize=1)
+def get_embedding_function() -> ONNXMiniLM_L6_V2:
+    """
+    Get the on-device embedding model used for the recipes collections.
+
+    The ONNX MiniLM model is loaded once per process and shared by every
+    collection handle, instead of being set up again for each collection.
+
+    Returns:
+        ONNXMiniLM_L6_V2: The shared embedding function
+    """
+    configure_performance_environment()
+    logger.info("Loading ONNX MiniLM-L6-v2 embedding model")
+    return ONNXMiniLM_L6_V2()
+
+
+@lru_cache(maxsize=1024)
+def _embed_query(query_text: str) -> tuple:
+    """
+    Embed a query string, memoized for repeated prompts.
+
+    Meal plan generation reuses the same handful of queries, so hits skip
+    the model forward pass entirely. Hit ratio is available from
+    _embed_query.cache_info().
+    """
+    return tuple(get_embedding_function()([query_text])[0].tolist())
 
 
 def initialize_chroma() -> chromadb.Client:
     """
     Initialize and return the Chroma DB client with persistent storage.
 
-    Uses a singleton pattern to avoid creating multiple clients.
+    Uses a double-checked lock so concurrent first requests create exactly
+    one client (and open the SQLite store once).
 
     Returns:
         chromadb.Client: The initialized Chroma client
@@ -34,37 +122,196 @@ def initialize_chroma() -> chromadb.Client:
     if _chroma_client is not None:
         return _chroma_client
 
-    logger.info(f"Initializing Chroma DB with persist directory: {settings.chroma_persist_dir}")
+    with _chroma_lock:
+        if _chroma_client is not None:
+            return _chroma_client
 
-    # Use PersistentClient for disk persistence
-    _chroma_client = chromadb.PersistentClient(
-        path=settings.chroma_persist_dir,
-        settings=ChromaSettings(anonymized_telemetry=False)
-    )
+        configure_performance_environment()
+        logger.info("Initializing Chroma DB with persist directory: %s", settings.chroma_persist_dir)
+
+        # Use PersistentClient for disk persistence
+        _chroma_client = chromadb.PersistentClient(
+            path=settings.chroma_persist_dir,
+            settings=ChromaSettings(anonymized_telemetry=False)
+        )
 
-    logger.info("Chroma DB initialized successfully")
-    return _chroma_client
+        try:
+            migrate_legacy_collection(_chroma_client)
+        except Exception as e:
+            logger.warning("Legacy recipes collection migration failed: %s", e)
+
+        logger.info("Chroma DB initialized successfully")
+        return _chroma_client
 
 
-def get_recipes_collection() -> chromadb.Collection:
+def warmup() -> None:
     """
-    Get or create the recipes collection in Chroma.
+    Open the Chroma client and load the embedding model ahead of traffic.
+
+    Both are otherwise loaded lazily by the first request that needs them.
+    Failures are logged rather than raised so a warmup problem never stops
+    the app from starting.
+    """
+    try:
+        initialize_chroma()
+        _embed_query("warmup")
+        logger.info("Chroma warmup complete")
+    except Exception as e:
+        logger.warning("Chroma warmup failed: %s", e)
+
+
+def _collection_name(workspace_id: str) -> str:
+    """Name of the Chroma collection holding a workspace's recipes"""
+    return f"{RECIPES_COLLECTION_PREFIX}{workspace_id}"
+
+
+def get_recipes_collection(workspace_id: str) -> chromadb.Collection:
+    """
+    Get or create a workspace's recipes collection in Chroma.
 
     The collection stores recipe embeddings with metadata for filtering.
+    Handles are cached per workspace after the first call, so only that
+    call pays for get_or_create_collection.
+
+    Args:
+        workspace_id: Workspace identifier
 
     Returns:
-        chromadb.Collection: The recipes collection
+        chromadb.Collection: The workspace's recipes collection
+    """
+    collection = _workspace_collections.get(workspace_id)
+    if collection is not None:
+        return collection
+
+    with _chroma_lock:
+        collection = _workspace_collections.get(workspace_id)
+        if collection is not None:
+            return collection
+
+        client = initialize_chroma()
+
+        # Get or create collection with the shared on-device embedding function
+        collection = client.get_or_create_collection(
+            name=_collection_name(workspace_id),
+            metadata={"description": "Recipe embeddings for meal planning RAG"},
+            embedding_function=get_embedding_function(),
+            configuration=RECIPES_COLLECTION_CONFIGURATION
+        )
+
+        # count() scans the collection, so only pay for it when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Retrieved recipes collection for workspace '%s' with %s documents", workspace_id, collection.count())
+        _workspace_collections[workspace_id] = collection
+        return collection
+
+
+def _legacy_list_metadata(value) -> List[str]:
+    """Decode a tags/appliances value written to the legacy collection"""
+    if not value:
+        return []
+    if isinstance(value, list):
+        return value
+    if value[0] == "[":
+        return json.loads(value)
+    return value.split(",")
+
+
+def migrate_legacy_collection(client: chromadb.Client, default_workspace_id: Optional[str] = None) -> int:
     """
-    client = initialize_chroma()
+    Move entries from the legacy shared 'recipes' collection into the
+    per-workspace collections.
 
-    # Get or create collection with default embedding function
-    collection = client.get_or_create_collection(
-        name=RECIPES_COLLECTION_NAME,
-        metadata={"description": "Recipe embeddings for meal planning RAG"}
-    )
+    Entries are grouped by their workspace_id metadata (or assigned to
+    default_workspace_id when they have none). The workspace prefix is
+    stripped from their IDs, workspace_id is dropped from their metadata
+    and list values are converted to native lists. Stored embeddings are
+    copied, so nothing is re-embedded. Migrated entries are removed from
+    the legacy collection, and the collection is dropped once it is empty.
+    Entries with no workspace are left in place and logged.
+
+    Args:
+        client: Chroma client to migrate
+        default_workspace_id: Workspace for entries without workspace_id
+
+    Returns:
+        int: Number of entries migrated
+    """
+    try:
+        legacy = client.get_collection(name=LEGACY_RECIPES_COLLECTION_NAME)
+    except Exception:
+        return 0
+
+    entries = legacy.get(include=["documents", "embeddings", "metadatas"])
+    by_workspace: Dict[str, Dict[str, list]] = {}
+    for i, legacy_id in enumerate(entries["ids"]):
+        metadata = dict(entries["metadatas"][i] or {})
+        workspace_id = metadata.pop("workspace_id", None) or default_workspace_id
+        if not workspace_id:
+            continue
+        recipe_id = legacy_id.split(":", 1)[1] if ":" in legacy_id else legacy_id
+        metadata["recipe_id"] = metadata.get("recipe_id") or recipe_id
+        for key in ("tags", "required_appliances"):
+            values = _legacy_list_metadata(metadata.pop(key, None))
+            if values:
+                metadata[key] = values
+        batch = by_workspace.setdefault(workspace_id, {
+            "legacy_ids": [], "ids": [], "documents": [], "embeddings": [], "metadatas": []
+        })
+        batch["legacy_ids"].append(legacy_id)
+        batch["ids"].append(recipe_id)
+        batch["documents"].append(entries["documents"][i])
+        batch["embeddings"].append(entries["embeddings"][i])
+        batch["metadatas"].append(metadata)
+
+    migrated = 0
+    for workspace_id, batch in by_workspace.items():
+        collection = get_recipes_collection(workspace_id)
+        for start in range(0, len(batch["ids"]), EMBED_BATCH_SIZE):
+            end = start + EMBED_BATCH_SIZE
+            collection.upsert(
+                ids=batch["ids"][start:end],
+                documents=batch["documents"][start:end],
+                embeddings=batch["embeddings"][start:end],
+                metadatas=batch["metadatas"][start:end],
+            )
+        legacy.delete(ids=batch["legacy_ids"])
+        migrated += len(batch["ids"])
+        logger.info("Migrated %s legacy Chroma entries to workspace '%s'", len(batch["ids"]), workspace_id)
+
+    remaining = len(entries["ids"]) - migrated
+    if remaining:
+        logger.warning(
+            "%s legacy Chroma entries have no workspace_id; run scripts/migrate_to_workspace.py to assign them",
+            remaining
+        )
+    else:
+        client.delete_collection(name=LEGACY_RECIPES_COLLECTION_NAME)
+        logger.info("Dropped legacy recipes collection")
+    return migrated
 
-    logger.info(f"Retrieved recipes collection with {collection.count()} documents")
-    return collection
+
+def _recipe_metadata(recipe: Recipe) -> Dict:
+    """
+    Build the Chroma metadata stored alongside a recipe embedding.
+
+    Tags and appliances are stored as native string lists so they can be
+    filtered server-side with $contains. Chroma rejects empty lists, so
+    those keys are omitted when the recipe has none.
+    """
+    metadata = {
+        "recipe_id": recipe.id,
+        "title": recipe.title,
+        "prep_time_minutes": recipe.prep_time_minutes,
+        "active_cooking_time_minutes": recipe.active_cooking_time_minutes,
+        "serves": recipe.serves,
+        "source_url": recipe.source_url or "",  # URL import feature - source tracking
+        "source_name": recipe.source_name or "",  # Display name of source (e.g., "Allrecipes")
+    }
+    if recipe.tags:
+        metadata["tags"] = recipe.tags
+    if recipe.required_appliances:
+        metadata["required_appliances"] = recipe.required_appliances
+    return metadata
 
 
 def embed_recipes(workspace_id: str, recipes: List[Recipe]) -> int:
@@ -77,7 +324,7 @@ def embed_recipes(workspace_id: str, recipes: List[Recipe]) -> int:
     - Ingredients (joined)
 
     Metadata is stored for filtering:
-    - workspace_id, id, tags, required_appliances, prep_time_minutes, active_cooking_time_minutes, serves
+    - id, tags, required_appliances, prep_time_minutes, active_cooking_time_minutes, serves
     - source_url, source_name (for imported recipes)
 
     Args:
@@ -91,49 +338,60 @@ def embed_recipes(workspace_id: str, recipes: List[Recipe]) -> int:
         logger.warning("No recipes provided to embed")
         return 0
 
-    collection = get_recipes_collection()
+    collection = get_recipes_collection(workspace_id)
+
+    n = len(recipes)
+    ids = [recipe.id for recipe in recipes]
+
+    # Text representation for embedding: title, tags and ingredients for
+    # semantic search. The tokenizer ignores whitespace after commas, so a
+    # plain CSV join of tags embeds the same as ", ".
+    documents = [
+        "".join((
+            recipe.title, " - Tags: ", ",".join(recipe.tags),
+            " - Ingredients: ", ", ".join(recipe.ingredients),
+        ))
+        for recipe in recipes
+    ]
+
+    # Store metadata for filtering
+    metadatas = [_recipe_metadata(recipe) for recipe in recipes]
+
+    # Embed with the shared model in fixed-size batches and hand Chroma the
+    # vectors directly (will update if IDs already exist)
+    embedding_function = get_embedding_function()
+    for start in range(0, n, EMBED_BATCH_SIZE):
+        end = start + EMBED_BATCH_SIZE
+        batch_documents = documents[start:end]
+        collection.add(
+            documents=batch_documents,
+            embeddings=embedding_function(batch_documents),
+            ids=ids[start:end],
+            metadatas=metadatas[start:end]
+        )
 
-    # Prepare documents, IDs, and metadata
-    documents = []
-    ids = []
-    metadatas = []
+    logger.info("Embedded %s recipes into Chroma DB for workspace '%s'", n, workspace_id)
+    return n
 
-    for recipe in recipes:
-        # Create text representation for embedding
-        # Combine title, tags, and ingredients for semantic search
-        text_representation = (
-            f"{recipe.title} - "
-            f"Tags: {', '.join(recipe.tags)} - "
-            f"Ingredients: {', '.join(recipe.ingredients)}"
-        )
 
-        documents.append(text_representation)
-        # Prefix recipe ID with workspace to ensure global uniqueness in Chroma
-        ids.append(f"{workspace_id}:{recipe.id}")
-
-        # Store metadata for filtering (including workspace_id for multi-tenancy)
-        metadatas.append({
-            "workspace_id": workspace_id,  # Critical for workspace isolation
-            "recipe_id": recipe.id,  # Original recipe ID without workspace prefix
-            "title": recipe.title,
-            "tags": ",".join(recipe.tags),  # Store as comma-separated string
-            "required_appliances": ",".join(recipe.required_appliances),
-            "prep_time_minutes": recipe.prep_time_minutes,
-            "active_cooking_time_minutes": recipe.active_cooking_time_minutes,
-            "serves": recipe.serves,
-            "source_url": recipe.source_url or "",  # URL import feature - source tracking
-            "source_name": recipe.source_name or "",  # Display name of source (e.g., "Allrecipes")
-        })
+def _recipe_ids_for_filter(filters: Optional[Dict]) -> Optional[List[str]]:
+    """
+    Extract the recipe IDs from a filter that only selects by recipe_id.
 
-    # Add to collection (will update if IDs already exist)
-    collection.add(
-        documents=documents,
-        ids=ids,
-        metadatas=metadatas
-    )
+    Chroma IDs are the recipe IDs, so such a filter resolves through the ID
+    index instead of a metadata scan. Returns None for any other filter.
+    """
+    if not filters or len(filters) != 1 or "recipe_id" not in filters:
+        return None
 
-    logger.info(f"Embedded {len(recipes)} recipes into Chroma DB for workspace '{workspace_id}'")
-    return len(recipes)
+    condition = filters["recipe_id"]
+    if isinstance(condition, str):
+        return [condition]
+    if isinstance(condition, dict) and len(condition) == 1 and "$eq" in condition:
+        return [condition["$eq"]]
+    if isinstance(condition, dict) and len(condition) == 1 and "$in" in condition:
+        return list(condition["$in"])
+    return None
 
 
 def query_recipes(
@@ -155,23 +413,43 @@ def query_recipes(
         List of dictionaries containing recipe metadata and similarity scores
         Each dict has: recipe_id, title, tags, required_appliances, distance (similarity score)
     """
-    collection = get_recipes_collection()
-
-    # Build workspace filter - CRITICAL for data isolation
-    workspace_filter = {"workspace_id": workspace_id}
-
-    # Combine workspace filter with any additional filters
-    if filters:
-        # Merge filters using $and operator
-        combined_filters = {"$and": [workspace_filter, filters]}
-    else:
-        combined_filters = workspace_filter
-
-    # Query with workspace-scoped filters
+    collection = get_recipes_collection(workspace_id)
+
+    candidate_ids = None
+    id_lookup = _recipe_ids_for_filter(filters)
+
+    if id_lookup is not None:
+        # Filter addresses known recipes: resolve which exist by ID alone
+        # (query() rejects unknown IDs) and skip the metadata filter
+        candidate_ids = collection.get(ids=id_lookup, include=[])["ids"]
+        if not candidate_ids:
+            logger.debug("Query '%s' for workspace '%s' returned 0 results (no filter matches)", query_text, workspace_id)
+            return []
+        n_results = min(n_results, len(candidate_ids))
+        filters = None
+    elif filters:
+        # Probe how selective the filter is: a narrow filter is cheaper to
+        # apply first and rank within, while ANN-then-filter would have to
+        # walk much of the graph to find enough matches
+        matched_ids = collection.get(
+            where=filters,
+            limit=SELECTIVE_FILTER_MAX_MATCHES + 1,
+            include=[]
+        )["ids"]
+        if not matched_ids:
+            logger.debug("Query '%s' for workspace '%s' returned 0 results (no filter matches)", query_text, workspace_id)
+            return []
+        if len(matched_ids) <= SELECTIVE_FILTER_MAX_MATCHES:
+            candidate_ids = matched_ids
+            n_results = min(n_results, len(matched_ids))
+
+    # Query the workspace's own collection; skip documents/embeddings we never read
     results = collection.query(
-        query_texts=[query_text],
+        query_embeddings=[list(_embed_query(query_text))],
+        ids=candidate_ids,
         n_results=n_results,
-        where=combined_filters
+        where=filters or None,
+        include=["metadatas", "distances"]
     )
 
     # Format results
@@ -182,22 +460,41 @@ def query_recipes(
             metadata = results['metadatas'][0][i] if results['metadatas'] else {}
             distance = results['distances'][0][i] if results['distances'] else None
 
-            # Use recipe_id from metadata (without workspace prefix)
             formatted_results.append({
-                "id": metadata.get("recipe_id", chroma_id),  # Original recipe ID
+                "id": chroma_id,
                 "title": metadata.get("title", ""),
-                "tags": metadata.get("tags", "").split(",") if metadata.get("tags") else [],
-                "required_appliances": metadata.get("required_appliances", "").split(",") if metadata.get("required_appliances") else [],
+                "tags": metadata.get("tags") or [],
+                "required_appliances": metadata.get("required_appliances") or [],
                 "prep_time_minutes": metadata.get("prep_time_minutes"),
                 "active_cooking_time_minutes": metadata.get("active_cooking_time_minutes"),
                 "serves": metadata.get("serves"),
                 "distance": distance,  # Lower distance = more similar
             })
 
-    logger.info(f"Query '{query_text}' for workspace '{workspace_id}' returned {len(formatted_results)} results")
+    logger.debug("Query '%s' for workspace '%s' returned %s results", query_text, workspace_id, len(formatted_results))
     return formatted_results
 
 
+def delete_recipes_from_chroma(workspace_id: str, recipe_ids: List[str]) -> None:
+    """
+    Delete several recipes from the Chroma vector database in one call.
+
+    Args:
+        workspace_id: Workspace identifier
+        recipe_ids: Recipe identifiers to delete
+    """
+    if not recipe_ids:
+        return
+
+    collection = get_recipes_collection(workspace_id)
+
+    try:
+        collection.delete(ids=list(recipe_ids))
+        logger.info("Removed %s recipes from Chroma DB for workspace '%s'", len(recipe_ids), workspace_id)
+    except Exception as e:
+        logger.warning("Could not remove %s from Chroma for workspace '%s' (may not exist): %s", recipe_ids, workspace_id, e)
+
+
 def delete_recipe_from_chroma(workspace_id: str, recipe_id: str) -> None:
     """
     Delete a recipe from the Chroma vector database.
@@ -206,14 +503,19 @@ def delete_recipe_from_chroma(workspace_id: str, recipe_id: str) -> None:
         workspace_id: Workspace identifier
         recipe_id: Recipe identifier to delete
     """
-    collection = get_recipes_collection()
-    chroma_id = f"{workspace_id}:{recipe_id}"
+    delete_recipes_from_chroma(workspace_id, [recipe_id])
+
 
+def _drop_workspace_collection(client: chromadb.Client, workspace_id: str) -> int:
+    """Delete a workspace's collection and cached handle; returns its entry count"""
+    _workspace_collections.pop(workspace_id, None)
+    name = _collection_name(workspace_id)
     try:
-        collection.delete(ids=[chroma_id])
-        logger.info(f"Removed recipe {recipe_id} from Chroma DB for workspace '{workspace_id}'")
-    except Exception as e:
-        logger.warning(f"Could not remove {recipe_id} from Chroma for workspace '{workspace_id}' (may not exist): {e}")
+        count = client.get_collection(name=name).count()
+    except Exception:
+        return 0
+    client.delete_collection(name=name)
+    return count
 
 
 def delete_workspace_from_chroma(workspace_id: str) -> int:
@@ -221,6 +523,7 @@ def delete_workspace_from_chroma(workspace_id: str) -> int:
     Delete all recipe embeddings for a workspace from Chroma DB.
 
     Used when deleting an entire workspace to prevent orphaned entries.
+    Drops the workspace's collection outright.
 
     Args:
         workspace_id: Workspace identifier to delete all recipes for
@@ -228,21 +531,27 @@ def delete_workspace_from_chroma(workspace_id: str) -> int:
     Returns:
         int: Number of entries deleted
     """
-    collection = get_recipes_collection()
-
-    # Get all entries for this workspace
-    results = collection.get(where={"workspace_id": workspace_id})
+    with _chroma_lock:
+        count = _drop_workspace_collection(initialize_chroma(), workspace_id)
 
-    if not results or not results['ids']:
-        logger.info(f"No Chroma entries found for workspace '{workspace_id}'")
+    if not count:
+        logger.info("No Chroma entries found for workspace '%s'", workspace_id)
         return 0
 
-    count = len(results['ids'])
-    collection.delete(ids=results['ids'])
-    logger.info(f"Deleted {count} Chroma entries for workspace '{workspace_id}'")
+    logger.info("Deleted %s Chroma entries for workspace '%s'", count, workspace_id)
     return count
 
 
+def _workspace_collection_ids(client: chromadb.Client) -> List[str]:
+    """Workspace IDs that have a recipes collection"""
+    prefix_len = len(RECIPES_COLLECTION_PREFIX)
+    return [
+        collection.name[prefix_len:]
+        for collection in client.list_collections()
+        if collection.name.startswith(RECIPES_COLLECTION_PREFIX)
+    ]
+
+
 def get_recipe_count(workspace_id: Optional[str] = None) -> int:
     """
     Get the total number of recipes in the collection.
@@ -253,43 +562,46 @@ def get_recipe_count(workspace_id: Optional[str] = None) -> int:
     Returns:
         int: Number of recipes stored in Chroma (total or for specific workspace)
     """
-    collection = get_recipes_collection()
-
     if workspace_id:
         # Count recipes for specific workspace
-        results = collection.get(where={"workspace_id": workspace_id})
-        count = len(results['ids']) if results and results['ids'] else 0
-        logger.info(f"Counted {count} recipes for workspace '{workspace_id}'")
+        count = get_recipes_collection(workspace_id).count()
+        logger.debug("Counted %s recipes for workspace '%s'", count, workspace_id)
         return count
     else:
         # Count all recipes across all workspaces
-        total = collection.count()
-        logger.info(f"Counted {total} total recipes across all workspaces")
+        client = initialize_chroma()
+        total = sum(
+            client.get_collection(name=_collection_name(ws)).count()
+            for ws in _workspace_collection_ids(client)
+        )
+        logger.info("Counted %s total recipes across all workspaces", total)
         return total
 
 
-def reset_collection() -> None:
-    """
-    Delete and recreate the recipes collection.
-
-    WARNING: This deletes all recipe embeddings!
-    Useful for testing or re-seeding data.
+def reset_collection(workspace_id: Optional[str] = None) -> None:
     """
-    client = initialize_chroma()
+    Delete a workspace's recipes collection, or every workspace's.
 
-    try:
-        client.delete_collection(name=RECIPES_COLLECTION_NAME)
-        logger.info(f"Deleted collection: {RECIPES_COLLECTION_NAME}")
-    except Exception as e:
-        logger.warning(f"Could not delete collection (may not exist): {e}")
+    WARNING: This deletes recipe embeddings!
+    Useful for testing or re-seeding data. Collections are recreated empty
+    on next use.
 
-    # Recreate empty collection
-    collection = client.create_collection(
-        name=RECIPES_COLLECTION_NAME,
-        metadata={"description": "Recipe embeddings for meal planning RAG"}
-    )
+    Args:
+        workspace_id: Optional workspace to reset; all workspaces when omitted
+    """
+    with _chroma_lock:
+        client = initialize_chroma()
+        workspace_ids = [workspace_id] if workspace_id else _workspace_collection_ids(client)
+        for ws in workspace_ids:
+            try:
+                _drop_workspace_collection(client, ws)
+                logger.info("Deleted collection: %s", _collection_name(ws))
+            except Exception as e:
+                logger.warning("Could not delete collection (may not exist): %s", e)
+        if not workspace_id:
+            _workspace_collections.clear()
 
-    logger.info(f"Reset collection: {RECIPES_COLLECTION_NAME}")
+    logger.info("Reset recipes collections: %s", workspace_ids)
 
 
 def sync_chroma_with_storage(workspace_id: str) -> dict:
@@ -307,40 +619,33 @@ def sync_chroma_with_storage(workspace_id: str) -> dict:
     """
     from app.data.data_manager import list_all_recipes
 
-    collection = get_recipes_collection()
+    collection = get_recipes_collection(workspace_id)
     all_recipes = list_all_recipes(workspace_id)  # Load from JSON for this workspace
-    recipe_ids_in_storage = {r.id for r in all_recipes}
-
-    # Get all IDs in Chroma for this workspace
-    chroma_results = collection.get(where={"workspace_id": workspace_id})
-    # Extract original recipe IDs from chroma_ids (remove workspace prefix)
-    chroma_ids = set()
-    chroma_full_ids = {}  # Map recipe_id -> full chroma_id for deletion
-    if chroma_results and chroma_results['ids']:
-        for chroma_id, metadata in zip(chroma_results['ids'], chroma_results['metadatas'] or []):
-            recipe_id = metadata.get('recipe_id', chroma_id.split(':', 1)[1] if ':' in chroma_id else chroma_id)
-            chroma_ids.add(recipe_id)
-            chroma_full_ids[recipe_id] = chroma_id
+    storage_ids = frozenset(r.id for r in all_recipes)
+
+    # Get all IDs in the workspace's collection (IDs only, no documents/metadata)
+    chroma_results = collection.get(include=[])
+    chroma_ids = chroma_results['ids'] if chroma_results else []
 
     # Find orphaned entries (in Chroma but not in storage)
-    orphaned = chroma_ids - recipe_ids_in_storage
-    if orphaned:
-        orphaned_full_ids = [chroma_full_ids[rid] for rid in orphaned if rid in chroma_full_ids]
-        collection.delete(ids=orphaned_full_ids)
-        logger.info(f"Removed {len(orphaned)} orphaned entries from Chroma for workspace '{workspace_id}': {orphaned}")
+    orphaned_ids = [recipe_id for recipe_id in chroma_ids if recipe_id not in storage_ids]
+    if orphaned_ids:
+        collection.delete(ids=orphaned_ids)
+        logger.info("Removed %s orphaned entries from Chroma for workspace '%s': %s", len(orphaned_ids), workspace_id, orphaned_ids[:LOG_MAX_IDS])
 
     # Find missing embeddings (in storage but not in Chroma)
-    missing = recipe_ids_in_storage - chroma_ids
-    if missing:
-        missing_recipes = [r for r in all_recipes if r.id in missing]
+    chroma_ids = frozenset(chroma_ids)
+    missing_recipes = [r for r in all_recipes if r.id not in chroma_ids]
+    if missing_recipes:
         embed_recipes(workspace_id, missing_recipes)
-        logger.info(f"Added {len(missing)} missing recipes to Chroma for workspace '{workspace_id}': {missing}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Added %s missing recipes to Chroma for workspace '%s': %s", len(missing_recipes), workspace_id, [r.id for r in missing_recipes[:LOG_MAX_IDS]])
 
     stats = {
-        "orphaned_removed": len(orphaned),
-        "missing_added": len(missing),
-        "total_in_sync": len(recipe_ids_in_storage)
+        "orphaned_removed": len(orphaned_ids),
+        "missing_added": len(missing_recipes),
+        "total_in_sync": len(storage_ids)
     }
 
-    logger.info(f"Chroma sync complete for workspace '{workspace_id}': {stats}")
+    logger.info("Chroma sync complete for workspace '%s': %s", workspace_id, stats)
     return stats
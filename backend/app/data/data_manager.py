@@ -8,8 +8,10 @@ Note: Row-Level Security (RLS) in Supabase provides an additional layer of
 data isolation at the database level.
 """
 import logging
-from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from datetime import date as Date, datetime
+from pydantic import TypeAdapter
 from app.models import Recipe, HouseholdProfile
 from app.models.grocery import GroceryItem, GroceryList
 from app.models.shopping import ShoppingListItem, ShoppingList, TemplateItem, TemplateList
@@ -19,6 +21,26 @@ from app.middleware.api_call_tracker import log_api_call
 
 logger = logging.getLogger(__name__)
 
+# Recipe columns read back from the recipes table. Every Recipe field is a
+# column (save_recipe upserts model_dump()); selecting them explicitly keeps
+# the 1536-float embedding vector off the wire for ordinary reads.
+RECIPE_COLUMNS = ", ".join(Recipe.model_fields)
+
+# Validate (and dump) whole lists of rows or items in one pydantic-core call
+# instead of one model_validate/model_dump round trip per element.
+_recipe_list_adapter = TypeAdapter(List[Recipe])
+_grocery_list_adapter = TypeAdapter(List[GroceryItem])
+_shopping_list_adapter = TypeAdapter(List[ShoppingListItem])
+_template_list_adapter = TypeAdapter(List[TemplateItem])
+
+# Shared pool for running independent Supabase queries concurrently. Each
+# query is a blocking HTTP round trip, so threads overlap the waiting.
+_query_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="supabase-query")
+
+# IDs per .in_() filter. PostgREST sends the list in the URL query string,
+# so very long lists are split to stay under request-line limits (HTTP 414).
+IN_FILTER_CHUNK_SIZE = 100
+
 
 def _get_client():
     """Get Supabase admin client for data operations."""
@@ -41,30 +63,26 @@ def list_workspaces() -> List[str]:
         supabase = _get_client()
         workspaces = set()
 
-        # Check profiles (users who have signed up)
-        try:
-            response = supabase.table("profiles").select("workspace_id").execute()
-            workspaces.update(row["workspace_id"] for row in response.data if row.get("workspace_id"))
-        except Exception:
-            pass
-
-        # Check household_profiles (migrated data)
-        try:
-            response = supabase.table("household_profiles").select("workspace_id").execute()
-            workspaces.update(row["workspace_id"] for row in response.data if row.get("workspace_id"))
-        except Exception:
-            pass
-
-        # Check recipes (migrated data)
-        try:
-            response = supabase.table("recipes").select("workspace_id").limit(1000).execute()
+        queries = [
+            # Check profiles (users who have signed up)
+            supabase.table("profiles").select("workspace_id"),
+            # Check household_profiles (migrated data)
+            supabase.table("household_profiles").select("workspace_id"),
+            # Check recipes (migrated data)
+            supabase.table("recipes").select("workspace_id").limit(1000),
+        ]
+        # Independent lookups, so issue them concurrently
+        futures = [_query_pool.submit(query.execute) for query in queries]
+        for future in futures:
+            try:
+                response = future.result()
+            except Exception:
+                continue
             workspaces.update(row["workspace_id"] for row in response.data if row.get("workspace_id"))
-        except Exception:
-            pass
 
         return sorted(workspaces)
     except Exception as e:
-        logger.error(f"Error listing workspaces: {e}")
+        logger.error("Error listing workspaces: %s", e)
         return []
 
 
@@ -89,25 +107,34 @@ def get_workspace_stats(workspace_id: str) -> Dict:
             "last_activity": None,
         }
 
-        # Recipe count
-        recipe_response = supabase.table("recipes").select("id", count="exact").eq("workspace_id", workspace_id).execute()
-        stats["recipe_count"] = recipe_response.count or 0
+        # The four lookups are independent, so issue them concurrently
+        queries = {
+            # Counts come from count="exact"; only one row is transferred
+            "recipes": supabase.table("recipes").select("id", count="exact").eq("workspace_id", workspace_id).limit(1),
+            # Meal plan count + most recent
+            "meal_plans": supabase.table("meal_plans").select("created_at", count="exact").eq("workspace_id", workspace_id).order("created_at", desc=True).limit(1),
+            # Grocery count - use regular query (not .single()) to avoid exception when no rows
+            "groceries": supabase.table("groceries").select("items").eq("workspace_id", workspace_id),
+            # Household member count - use regular query (not .single()) to avoid exception when no rows
+            "household": supabase.table("household_profiles").select("family_members").eq("workspace_id", workspace_id),
+        }
+        futures = {name: _query_pool.submit(query.execute) for name, query in queries.items()}
+        responses = {name: future.result() for name, future in futures.items()}
+
+        stats["recipe_count"] = responses["recipes"].count or 0
 
-        # Meal plan count + most recent
-        meal_plan_response = supabase.table("meal_plans").select("id, created_at").eq("workspace_id", workspace_id).order("created_at", desc=True).execute()
-        stats["meal_plan_count"] = len(meal_plan_response.data)
+        meal_plan_response = responses["meal_plans"]
+        stats["meal_plan_count"] = meal_plan_response.count or 0
         if meal_plan_response.data:
             stats["last_meal_plan_date"] = meal_plan_response.data[0]["created_at"]
             stats["last_activity"] = meal_plan_response.data[0]["created_at"]
 
-        # Grocery count - use regular query (not .single()) to avoid exception when no rows
-        grocery_response = supabase.table("groceries").select("items").eq("workspace_id", workspace_id).execute()
+        grocery_response = responses["groceries"]
         if grocery_response.data:
             items = grocery_response.data[0].get("items", [])
             stats["grocery_count"] = len(items) if items else 0
 
-        # Household member count - use regular query (not .single()) to avoid exception when no rows
-        household_response = supabase.table("household_profiles").select("family_members").eq("workspace_id", workspace_id).execute()
+        household_response = responses["household"]
         if household_response.data:
             members = household_response.data[0].get("family_members", [])
             stats["member_count"] = len(members) if members else 0
@@ -115,7 +142,7 @@ def get_workspace_stats(workspace_id: str) -> Dict:
         return stats
 
     except Exception as e:
-        logger.error(f"Error getting workspace stats for '{workspace_id}': {e}")
+        logger.error("Error getting workspace stats for '%s': %s", workspace_id, e)
         return {"error": str(e), "workspace_id": workspace_id}
 
 
@@ -134,7 +161,7 @@ def get_user_email_map() -> Dict[str, Optional[str]]:
         response = supabase.auth.admin.list_users()
         return {user.id: user.email for user in response}
     except Exception as e:
-        logger.error(f"Error fetching user emails: {e}")
+        logger.error("Error fetching user emails: %s", e)
         return {}
 
 
@@ -148,17 +175,28 @@ def is_workspace_empty(workspace_id: str) -> bool:
     Returns:
         True if workspace is empty, False otherwise
     """
-    stats = get_workspace_stats(workspace_id)
+    try:
+        supabase = _get_client()
+
+        # Stop at the first source with data; each check fetches at most one row
+        if supabase.table("recipes").select("id").eq("workspace_id", workspace_id).limit(1).execute().data:
+            return False
+        if supabase.table("meal_plans").select("id").eq("workspace_id", workspace_id).limit(1).execute().data:
+            return False
+
+        grocery_response = supabase.table("groceries").select("items").eq("workspace_id", workspace_id).execute()
+        if grocery_response.data and grocery_response.data[0].get("items"):
+            return False
+
+        household_response = supabase.table("household_profiles").select("family_members").eq("workspace_id", workspace_id).execute()
+        if household_response.data and household_response.data[0].get("family_members"):
+            return False
 
-    if "error" in stats:
         return True
 
-    return (
-        stats.get("recipe_count", 0) == 0 and
-        stats.get("meal_plan_count", 0) == 0 and
-        stats.get("grocery_count", 0) == 0 and
-        stats.get("member_count", 0) == 0
-    )
+    except Exception as e:
+        logger.error("Error checking whether workspace '%s' is empty: %s", workspace_id, e)
+        return True
 
 
 def delete_workspace(workspace_id: str) -> bool:
@@ -196,15 +234,15 @@ def delete_workspace(workspace_id: str) -> bool:
         try:
             from app.data.chroma_manager import delete_workspace_from_chroma
             chroma_deleted = delete_workspace_from_chroma(workspace_id)
-            logger.info(f"Cleaned up {chroma_deleted} Chroma entries for workspace '{workspace_id}'")
+            logger.info("Cleaned up %s Chroma entries for workspace '%s'", chroma_deleted, workspace_id)
         except ImportError:
             logger.debug("Chroma not available, skipping Chroma cleanup")
 
-        logger.info(f"Deleted all data for workspace '{workspace_id}'")
+        logger.info("Deleted all data for workspace '%s'", workspace_id)
         return True
 
     except Exception as e:
-        logger.error(f"Error deleting workspace '{workspace_id}': {e}")
+        logger.error("Error deleting workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -239,11 +277,11 @@ def delete_account(workspace_id: str) -> dict:
         # workspace_id is the user's UUID in this system
         try:
             supabase.auth.admin.delete_user(workspace_id)
-            logger.info(f"Deleted auth user '{workspace_id}'")
+            logger.info("Deleted auth user '%s'", workspace_id)
         except Exception as auth_error:
             # Log but don't fail if user doesn't exist in auth
             # (data might have been orphaned)
-            logger.warning(f"Could not delete auth user '{workspace_id}': {auth_error}")
+            logger.warning("Could not delete auth user '%s': %s", workspace_id, auth_error)
 
         return {
             "workspace_id": workspace_id,
@@ -252,7 +290,7 @@ def delete_account(workspace_id: str) -> dict:
         }
 
     except Exception as e:
-        logger.error(f"Error deleting account '{workspace_id}': {e}")
+        logger.error("Error deleting account '%s': %s", workspace_id, e)
         raise
 
 
@@ -273,7 +311,7 @@ def load_household_profile(workspace_id: str) -> Optional[HouseholdProfile]:
         response = supabase.table("household_profiles").select("*").eq("workspace_id", workspace_id).single().execute()
 
         if not response.data:
-            logger.warning(f"Household profile not found for workspace '{workspace_id}'")
+            logger.warning("Household profile not found for workspace '%s'", workspace_id)
             return None
 
         data = response.data
@@ -285,14 +323,14 @@ def load_household_profile(workspace_id: str) -> Optional[HouseholdProfile]:
             onboarding_status=data.get("onboarding_status", {}),
             onboarding_data=data.get("onboarding_data", {})
         )
-        logger.info(f"Loaded household profile for workspace '{workspace_id}' with {len(profile.family_members)} members")
+        logger.debug("Loaded household profile for workspace '%s' with %s members", workspace_id, len(profile.family_members))
         return profile
 
     except Exception as e:
         if "PGRST116" in str(e):  # No rows returned
-            logger.warning(f"Household profile not found for workspace '{workspace_id}'")
+            logger.warning("Household profile not found for workspace '%s'", workspace_id)
             return None
-        logger.error(f"Error loading household profile for workspace '{workspace_id}': {e}")
+        logger.error("Error loading household profile for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -326,10 +364,10 @@ def save_household_profile(workspace_id: str, profile: HouseholdProfile) -> None
             ]
 
         supabase.table("household_profiles").upsert(data, on_conflict="workspace_id").execute()
-        logger.info(f"Saved household profile for workspace '{workspace_id}'")
+        logger.info("Saved household profile for workspace '%s'", workspace_id)
 
     except Exception as e:
-        logger.error(f"Error saving household profile for workspace '{workspace_id}': {e}")
+        logger.error("Error saving household profile for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -350,21 +388,21 @@ def load_groceries(workspace_id: str) -> List[GroceryItem]:
         response = supabase.table("groceries").select("items").eq("workspace_id", workspace_id).single().execute()
 
         if not response.data:
-            logger.info(f"No groceries found for workspace '{workspace_id}'")
+            logger.debug("No groceries found for workspace '%s'", workspace_id)
             return []
 
         items_data = response.data.get("items", [])
         if not items_data:
             return []
 
-        items = [GroceryItem(**item) for item in items_data]
-        logger.info(f"Loaded {len(items)} grocery items for workspace '{workspace_id}'")
+        items = _grocery_list_adapter.validate_python(items_data)
+        logger.debug("Loaded %s grocery items for workspace '%s'", len(items), workspace_id)
         return items
 
     except Exception as e:
         if "PGRST116" in str(e):  # No rows returned
             return []
-        logger.error(f"Error loading groceries for workspace '{workspace_id}': {e}")
+        logger.error("Error loading groceries for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -379,7 +417,7 @@ def save_groceries(workspace_id: str, items: List[GroceryItem]) -> None:
     try:
         supabase = _get_client()
 
-        items_data = [item.model_dump(mode='json') for item in items]
+        items_data = _grocery_list_adapter.dump_python(items, mode='json')
 
         data = {
             "workspace_id": workspace_id,
@@ -388,10 +426,10 @@ def save_groceries(workspace_id: str, items: List[GroceryItem]) -> None:
         }
 
         supabase.table("groceries").upsert(data, on_conflict="workspace_id").execute()
-        logger.info(f"Saved {len(items)} grocery items for workspace '{workspace_id}'")
+        logger.info("Saved %s grocery items for workspace '%s'", len(items), workspace_id)
 
     except Exception as e:
-        logger.error(f"Error saving groceries for workspace '{workspace_id}': {e}")
+        logger.error("Error saving groceries for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -412,21 +450,21 @@ def load_shopping_list(workspace_id: str) -> List[ShoppingListItem]:
         response = supabase.table("shopping_lists").select("items").eq("workspace_id", workspace_id).single().execute()
 
         if not response.data:
-            logger.info(f"No shopping list found for workspace '{workspace_id}'")
+            logger.debug("No shopping list found for workspace '%s'", workspace_id)
             return []
 
         items_data = response.data.get("items", [])
         if not items_data:
             return []
 
-        items = [ShoppingListItem(**item) for item in items_data]
-        logger.info(f"Loaded {len(items)} shopping list items for workspace '{workspace_id}'")
+        items = _shopping_list_adapter.validate_python(items_data)
+        logger.debug("Loaded %s shopping list items for workspace '%s'", len(items), workspace_id)
         return items
 
     except Exception as e:
         if "PGRST116" in str(e):  # No rows returned
             return []
-        logger.error(f"Error loading shopping list for workspace '{workspace_id}': {e}")
+        logger.error("Error loading shopping list for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -441,7 +479,7 @@ def save_shopping_list(workspace_id: str, items: List[ShoppingListItem]) -> None
     try:
         supabase = _get_client()
 
-        items_data = [item.model_dump(mode='json') for item in items]
+        items_data = _shopping_list_adapter.dump_python(items, mode='json')
 
         data = {
             "workspace_id": workspace_id,
@@ -450,10 +488,10 @@ def save_shopping_list(workspace_id: str, items: List[ShoppingListItem]) -> None
         }
 
         supabase.table("shopping_lists").upsert(data, on_conflict="workspace_id").execute()
-        logger.info(f"Saved {len(items)} shopping list items for workspace '{workspace_id}'")
+        logger.info("Saved %s shopping list items for workspace '%s'", len(items), workspace_id)
 
     except Exception as e:
-        logger.error(f"Error saving shopping list for workspace '{workspace_id}': {e}")
+        logger.error("Error saving shopping list for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -465,7 +503,7 @@ def clear_shopping_list(workspace_id: str) -> None:
         workspace_id: Workspace identifier
     """
     save_shopping_list(workspace_id, [])
-    logger.info(f"Cleared shopping list for workspace '{workspace_id}'")
+    logger.info("Cleared shopping list for workspace '%s'", workspace_id)
 
 
 # ===== Shopping Templates =====
@@ -485,21 +523,21 @@ def load_shopping_templates(workspace_id: str) -> List[TemplateItem]:
         response = supabase.table("shopping_templates").select("items").eq("workspace_id", workspace_id).single().execute()
 
         if not response.data:
-            logger.info(f"No shopping templates found for workspace '{workspace_id}'")
+            logger.debug("No shopping templates found for workspace '%s'", workspace_id)
             return []
 
         items_data = response.data.get("items", [])
         if not items_data:
             return []
 
-        templates = [TemplateItem(**item) for item in items_data]
-        logger.info(f"Loaded {len(templates)} shopping templates for workspace '{workspace_id}'")
+        templates = _template_list_adapter.validate_python(items_data)
+        logger.debug("Loaded %s shopping templates for workspace '%s'", len(templates), workspace_id)
         return templates
 
     except Exception as e:
         if "PGRST116" in str(e):  # No rows returned
             return []
-        logger.error(f"Error loading shopping templates for workspace '{workspace_id}': {e}")
+        logger.error("Error loading shopping templates for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -514,7 +552,7 @@ def save_shopping_templates(workspace_id: str, templates: List[TemplateItem]) ->
     try:
         supabase = _get_client()
 
-        items_data = [template.model_dump(mode='json') for template in templates]
+        items_data = _template_list_adapter.dump_python(templates, mode='json')
 
         data = {
             "workspace_id": workspace_id,
@@ -523,10 +561,10 @@ def save_shopping_templates(workspace_id: str, templates: List[TemplateItem]) ->
         }
 
         supabase.table("shopping_templates").upsert(data, on_conflict="workspace_id").execute()
-        logger.info(f"Saved {len(templates)} shopping templates for workspace '{workspace_id}'")
+        logger.info("Saved %s shopping templates for workspace '%s'", len(templates), workspace_id)
 
     except Exception as e:
-        logger.error(f"Error saving shopping templates for workspace '{workspace_id}': {e}")
+        logger.error("Error saving shopping templates for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -550,11 +588,11 @@ def load_recipe_ratings(workspace_id: str) -> dict:
         for row in response.data:
             ratings_dict[row["recipe_id"]] = row.get("ratings", {})
 
-        logger.info(f"Loaded ratings for {len(ratings_dict)} recipes in workspace '{workspace_id}'")
+        logger.debug("Loaded ratings for %s recipes in workspace '%s'", len(ratings_dict), workspace_id)
         return ratings_dict
 
     except Exception as e:
-        logger.error(f"Error loading recipe ratings for workspace '{workspace_id}': {e}")
+        logger.error("Error loading recipe ratings for workspace '%s': %s", workspace_id, e)
         return {}
 
 
@@ -597,7 +635,7 @@ def save_recipe_rating(workspace_id: str, recipe_id: str, member_name: str, rati
         }
 
         supabase.table("recipe_ratings").upsert(data, on_conflict="workspace_id,recipe_id").execute()
-        logger.info(f"Saved rating for {recipe_id} by {member_name} in workspace '{workspace_id}': {rating}")
+        logger.info("Saved rating for %s by %s in workspace '%s': %s", recipe_id, member_name, workspace_id, rating)
         return current_ratings
 
     except Exception as e:
@@ -613,7 +651,7 @@ def save_recipe_rating(workspace_id: str, recipe_id: str, member_name: str, rati
             supabase.table("recipe_ratings").insert(data).execute()
             return data["ratings"]
 
-        logger.error(f"Error saving recipe rating for workspace '{workspace_id}': {e}")
+        logger.error("Error saving recipe rating for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -639,7 +677,7 @@ def get_recipe_rating(workspace_id: str, recipe_id: str) -> Dict[str, Optional[s
     except Exception as e:
         if "PGRST116" in str(e):  # No rows returned
             return {}
-        logger.error(f"Error getting recipe rating for workspace '{workspace_id}': {e}")
+        logger.error("Error getting recipe rating for workspace '%s': %s", workspace_id, e)
         return {}
 
 
@@ -654,10 +692,10 @@ def delete_recipe_rating(workspace_id: str, recipe_id: str) -> None:
     try:
         supabase = _get_client()
         supabase.table("recipe_ratings").delete().eq("workspace_id", workspace_id).eq("recipe_id", recipe_id).execute()
-        logger.info(f"Deleted ratings for recipe {recipe_id} in workspace '{workspace_id}'")
+        logger.info("Deleted ratings for recipe %s in workspace '%s'", recipe_id, workspace_id)
 
     except Exception as e:
-        logger.error(f"Error deleting recipe ratings for workspace '{workspace_id}': {e}")
+        logger.error("Error deleting recipe ratings for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -676,26 +714,21 @@ def load_recipe(workspace_id: str, recipe_id: str) -> Optional[Recipe]:
     """
     try:
         supabase = _get_client()
-        response = supabase.table("recipes").select("*").eq("workspace_id", workspace_id).eq("id", recipe_id).single().execute()
+        response = supabase.table("recipes").select(RECIPE_COLUMNS).eq("workspace_id", workspace_id).eq("id", recipe_id).single().execute()
 
         if not response.data:
-            logger.warning(f"Recipe {recipe_id} not found in workspace '{workspace_id}'")
+            logger.warning("Recipe %s not found in workspace '%s'", recipe_id, workspace_id)
             return None
 
-        data = response.data
-        # Remove Supabase-specific fields
-        data.pop("embedding", None)
-        data.pop("workspace_id", None)
-
-        recipe = Recipe(**data)
-        logger.info(f"Loaded recipe: {recipe.title} from workspace '{workspace_id}'")
+        recipe = Recipe.model_validate(response.data)
+        logger.debug("Loaded recipe: %s from workspace '%s'", recipe.title, workspace_id)
         return recipe
 
     except Exception as e:
         if "PGRST116" in str(e):  # No rows returned
-            logger.warning(f"Recipe {recipe_id} not found in workspace '{workspace_id}'")
+            logger.warning("Recipe %s not found in workspace '%s'", recipe_id, workspace_id)
             return None
-        logger.error(f"Error loading recipe {recipe_id} for workspace '{workspace_id}': {e}")
+        logger.error("Error loading recipe %s for workspace '%s': %s", recipe_id, workspace_id, e)
         raise
 
 
@@ -720,10 +753,10 @@ def save_recipe(workspace_id: str, recipe: Recipe) -> None:
             data["embedding"] = embedding
 
         supabase.table("recipes").upsert(data, on_conflict="id").execute()
-        logger.info(f"Saved recipe: {recipe.title} to workspace '{workspace_id}'")
+        logger.info("Saved recipe: %s to workspace '%s'", recipe.title, workspace_id)
 
     except Exception as e:
-        logger.error(f"Error saving recipe {recipe.id} for workspace '{workspace_id}': {e}")
+        logger.error("Error saving recipe %s for workspace '%s': %s", recipe.id, workspace_id, e)
         raise
 
 
@@ -740,20 +773,80 @@ def list_all_recipes(workspace_id: str) -> List[Recipe]:
     """
     try:
         supabase = _get_client()
-        response = supabase.table("recipes").select("*").eq("workspace_id", workspace_id).order("updated_at", desc=True).execute()
+        response = supabase.table("recipes").select(RECIPE_COLUMNS).eq("workspace_id", workspace_id).order("updated_at", desc=True).execute()
 
-        recipes = []
-        for data in response.data:
-            # Remove Supabase-specific fields
-            data.pop("embedding", None)
-            data.pop("workspace_id", None)
-            recipes.append(Recipe(**data))
+        recipes = _recipe_list_adapter.validate_python(response.data)
 
-        logger.info(f"Loaded {len(recipes)} recipes for workspace '{workspace_id}'")
+        logger.debug("Loaded %s recipes for workspace '%s'", len(recipes), workspace_id)
         return recipes
 
     except Exception as e:
-        logger.error(f"Error listing recipes for workspace '{workspace_id}': {e}")
+        logger.error("Error listing recipes for workspace '%s': %s", workspace_id, e)
+        raise
+
+
+def load_recipes_by_ids(workspace_id: str, recipe_ids: List[str]) -> List[Recipe]:
+    """
+    Load several recipes in one query per IN_FILTER_CHUNK_SIZE IDs.
+
+    Args:
+        workspace_id: Workspace identifier
+        recipe_ids: Recipe identifiers to load
+
+    Returns:
+        Recipes in the order of recipe_ids; IDs that don't exist are skipped
+    """
+    if not recipe_ids:
+        return []
+
+    try:
+        supabase = _get_client()
+        unique_ids = list(dict.fromkeys(recipe_ids))
+        queries = [
+            supabase.table("recipes").select(RECIPE_COLUMNS).eq("workspace_id", workspace_id).in_("id", unique_ids[start:start + IN_FILTER_CHUNK_SIZE])
+            for start in range(0, len(unique_ids), IN_FILTER_CHUNK_SIZE)
+        ]
+        if len(queries) == 1:
+            rows = queries[0].execute().data
+        else:
+            # Independent chunks, so issue them concurrently
+            futures = [_query_pool.submit(query.execute) for query in queries]
+            rows = [row for future in futures for row in future.result().data]
+
+        recipes_by_id = {recipe.id: recipe for recipe in _recipe_list_adapter.validate_python(rows)}
+
+        logger.debug("Loaded %s of %s requested recipes for workspace '%s'", len(recipes_by_id), len(recipe_ids), workspace_id)
+        return [recipes_by_id[recipe_id] for recipe_id in recipe_ids if recipe_id in recipes_by_id]
+
+    except Exception as e:
+        logger.error("Error loading recipes by ID for workspace '%s': %s", workspace_id, e)
+        raise
+
+
+def list_recipe_summaries(workspace_id: str) -> List[Dict]:
+    """
+    List lightweight recipe summaries for a workspace.
+
+    Fetches only the columns listing and counting views need, skipping
+    ingredients, instructions and the embedding vector, and returns plain
+    dicts without Recipe validation.
+    Summaries are sorted by updated_at (most recent first).
+
+    Args:
+        workspace_id: Workspace identifier
+
+    Returns:
+        List of dicts with id, title, tags, meal_types and updated_at
+    """
+    try:
+        supabase = _get_client()
+        response = supabase.table("recipes").select("id, title, tags, meal_types, updated_at").eq("workspace_id", workspace_id).order("updated_at", desc=True).execute()
+
+        logger.debug("Loaded %s recipe summaries for workspace '%s'", len(response.data), workspace_id)
+        return response.data
+
+    except Exception as e:
+        logger.error("Error listing recipe summaries for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -774,7 +867,7 @@ def delete_recipe(workspace_id: str, recipe_id: str) -> bool:
         # Check if recipe exists
         check = supabase.table("recipes").select("id").eq("workspace_id", workspace_id).eq("id", recipe_id).single().execute()
         if not check.data:
-            logger.warning(f"Recipe {recipe_id} not found in workspace '{workspace_id}'")
+            logger.warning("Recipe %s not found in workspace '%s'", recipe_id, workspace_id)
             return False
 
         # Delete the recipe
@@ -783,13 +876,13 @@ def delete_recipe(workspace_id: str, recipe_id: str) -> bool:
         # Also delete associated ratings
         delete_recipe_rating(workspace_id, recipe_id)
 
-        logger.info(f"Deleted recipe {recipe_id} from workspace '{workspace_id}'")
+        logger.info("Deleted recipe %s from workspace '%s'", recipe_id, workspace_id)
         return True
 
     except Exception as e:
         if "PGRST116" in str(e):  # No rows returned
             return False
-        logger.error(f"Error deleting recipe {recipe_id} for workspace '{workspace_id}': {e}")
+        logger.error("Error deleting recipe %s for workspace '%s': %s", recipe_id, workspace_id, e)
         raise
 
 
@@ -811,20 +904,20 @@ def load_meal_plan(workspace_id: str, meal_plan_id: str) -> Optional[MealPlan]:
         response = supabase.table("meal_plans").select("*").eq("workspace_id", workspace_id).eq("id", meal_plan_id).single().execute()
 
         if not response.data:
-            logger.warning(f"Meal plan {meal_plan_id} not found in workspace '{workspace_id}'")
+            logger.warning("Meal plan %s not found in workspace '%s'", meal_plan_id, workspace_id)
             return None
 
         data = response.data
         data.pop("workspace_id", None)
 
-        meal_plan = MealPlan(**data)
-        logger.info(f"Loaded meal plan: {meal_plan_id} from workspace '{workspace_id}'")
+        meal_plan = MealPlan.model_validate(data)
+        logger.debug("Loaded meal plan: %s from workspace '%s'", meal_plan_id, workspace_id)
         return meal_plan
 
     except Exception as e:
         if "PGRST116" in str(e):  # No rows returned
             return None
-        logger.error(f"Error loading meal plan {meal_plan_id} for workspace '{workspace_id}': {e}")
+        logger.error("Error loading meal plan %s for workspace '%s': %s", meal_plan_id, workspace_id, e)
         raise
 
 
@@ -844,10 +937,10 @@ def save_meal_plan(workspace_id: str, meal_plan: MealPlan) -> None:
         data["updated_at"] = datetime.now().isoformat()
 
         supabase.table("meal_plans").upsert(data, on_conflict="id").execute()
-        logger.info(f"Saved meal plan: {meal_plan.id} to workspace '{workspace_id}'")
+        logger.info("Saved meal plan: %s to workspace '%s'", meal_plan.id, workspace_id)
 
     except Exception as e:
-        logger.error(f"Error saving meal plan {meal_plan.id} for workspace '{workspace_id}': {e}")
+        logger.error("Error saving meal plan %s for workspace '%s': %s", meal_plan.id, workspace_id, e)
         raise
 
 
@@ -870,13 +963,13 @@ def list_all_meal_plans(workspace_id: str) -> List[MealPlan]:
         meal_plans = []
         for data in response.data:
             data.pop("workspace_id", None)
-            meal_plans.append(MealPlan(**data))
+            meal_plans.append(MealPlan.model_validate(data))
 
-        logger.info(f"Loaded {len(meal_plans)} meal plans for workspace '{workspace_id}'")
+        logger.debug("Loaded %s meal plans for workspace '%s'", len(meal_plans), workspace_id)
         return meal_plans
 
     except Exception as e:
-        logger.error(f"Error listing meal plans for workspace '{workspace_id}': {e}")
+        logger.error("Error listing meal plans for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -897,19 +990,19 @@ def delete_meal_plan(workspace_id: str, meal_plan_id: str) -> bool:
         # Check if meal plan exists
         check = supabase.table("meal_plans").select("id").eq("workspace_id", workspace_id).eq("id", meal_plan_id).single().execute()
         if not check.data:
-            logger.warning(f"Meal plan {meal_plan_id} not found in workspace '{workspace_id}'")
+            logger.warning("Meal plan %s not found in workspace '%s'", meal_plan_id, workspace_id)
             return False
 
         # Delete the meal plan
         supabase.table("meal_plans").delete().eq("workspace_id", workspace_id).eq("id", meal_plan_id).execute()
 
-        logger.info(f"Deleted meal plan {meal_plan_id} from workspace '{workspace_id}'")
+        logger.info("Deleted meal plan %s from workspace '%s'", meal_plan_id, workspace_id)
         return True
 
     except Exception as e:
         if "PGRST116" in str(e):  # No rows returned
             return False
-        logger.error(f"Error deleting meal plan {meal_plan_id} for workspace '{workspace_id}': {e}")
+        logger.error("Error deleting meal plan %s for workspace '%s': %s", meal_plan_id, workspace_id, e)
         raise
 
 
@@ -929,15 +1022,15 @@ def load_meal_plan_by_week(workspace_id: str, week_start_date: str) -> Optional[
         response = supabase.table("meal_plans").select("*").eq("workspace_id", workspace_id).eq("week_start_date", week_start_date).maybe_single().execute()
 
         if not response.data:
-            logger.info(f"No meal plan found for week {week_start_date} in workspace '{workspace_id}'")
+            logger.debug("No meal plan found for week %s in workspace '%s'", week_start_date, workspace_id)
             return None
 
         data = response.data
         data.pop("workspace_id", None)
-        return MealPlan(**data)
+        return MealPlan.model_validate(data)
 
     except Exception as e:
-        logger.error(f"Error loading meal plan for week {week_start_date} in workspace '{workspace_id}': {e}")
+        logger.error("Error loading meal plan for week %s in workspace '%s': %s", week_start_date, workspace_id, e)
         raise
 
 
@@ -956,11 +1049,11 @@ def list_meal_plan_weeks(workspace_id: str) -> List[str]:
         response = supabase.table("meal_plans").select("week_start_date").eq("workspace_id", workspace_id).order("week_start_date", desc=True).execute()
 
         weeks = [str(row["week_start_date"]) for row in response.data]
-        logger.info(f"Found {len(weeks)} meal plan weeks for workspace '{workspace_id}'")
+        logger.debug("Found %s meal plan weeks for workspace '%s'", len(weeks), workspace_id)
         return weeks
 
     except Exception as e:
-        logger.error(f"Error listing meal plan weeks for workspace '{workspace_id}': {e}")
+        logger.error("Error listing meal plan weeks for workspace '%s': %s", workspace_id, e)
         raise
 
 
@@ -1025,7 +1118,7 @@ def _generate_recipe_embedding(recipe: Recipe, workspace_id: Optional[str] = Non
             model="text-embedding-3-small",
             error=str(e)
         )
-        logger.error(f"Error generating embedding for recipe {recipe.id}: {e}")
+        logger.error("Error generating embedding for recipe %s: %s", recipe.id, e)
         return None
 
 
@@ -1083,19 +1176,15 @@ def query_recipes(
         }).execute()
 
         if not response.data:
-            logger.info(f"No vector matches for query '{query_text}', falling back to text search")
+            logger.info("No vector matches for query '%s', falling back to text search", query_text)
             return _text_search_recipes(workspace_id, query_text, n_results, filters)
 
         # Get matched recipe IDs
         matched_ids = [r['id'] for r in response.data]
-        logger.info(f"Vector search found {len(matched_ids)} recipes for query '{query_text[:50]}...'")
+        logger.info("Vector search found %s recipes for query '%s...'", len(matched_ids), query_text[:50])
 
-        # Fetch full recipe objects for matched IDs
-        recipes = []
-        for recipe_id in matched_ids:
-            recipe = load_recipe(workspace_id, recipe_id)
-            if recipe:
-                recipes.append(recipe)
+        # Fetch full recipe objects for matched IDs in one query, keeping similarity order
+        recipes = load_recipes_by_ids(workspace_id, matched_ids)
 
         # If vector search returned results but we couldn't load them, fall back
         if not recipes and matched_ids:
@@ -1105,7 +1194,7 @@ def query_recipes(
         return recipes
 
     except Exception as e:
-        logger.error(f"Error querying recipes for workspace '{workspace_id}': {e}")
+        logger.error("Error querying recipes for workspace '%s': %s", workspace_id, e)
         return _text_search_recipes(workspace_id, query_text, n_results, filters)
 
 
@@ -1174,9 +1263,9 @@ def _text_search_recipes(
 
         # Fallback: if no matches, return most recent recipes
         # This ensures meal plan generation always has recipes to work with
-        logger.info(f"Text search found no matches, returning {n_results} most recent recipes")
+        logger.info("Text search found no matches, returning %s most recent recipes", n_results)
         return all_recipes[:n_results]
 
     except Exception as e:
-        logger.error(f"Error in text search for workspace '{workspace_id}': {e}")
+        logger.error("Error in text search for workspace '%s': %s", workspace_id, e)
         return []
@@ -1,33 +1,73 @@
 """
 Invite code data management.
 
-Stores invite codes in JSON file under data/invites.json.
+Stores invite codes in JSON file under data/invites.json and redemptions
+as an append-only JSONL log under data/invite_redemptions.jsonl.
 """
-import json
 import logging
 import secrets
 import string
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Tuple, Dict, Optional, List
 from app.config import settings
+from app.data.json_files import (
+    append_json_line, iter_json_lines, read_json, write_json, write_json_lines
+)
 from app.models.invite import InviteCode, InviteRedemption
 
 logger = logging.getLogger(__name__)
 
+# Legacy redemptions file already migrated (or found absent) in this process
+_legacy_redemptions_checked: Optional[Path] = None
+_legacy_redemptions_lock = threading.Lock()
+
 
 def _get_invites_file() -> Path:
-    """Get the invites data file path."""
-    data_dir = Path(settings.DATA_DIR)
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir / "invites.json"
+    """Get the invites data file path (created on first save)."""
+    return Path(settings.DATA_DIR) / "invites.json"
 
 
 def _get_redemptions_file() -> Path:
-    """Get the redemptions data file path."""
-    data_dir = Path(settings.DATA_DIR)
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir / "invite_redemptions.json"
+    """Get the redemptions log path (JSONL, one redemption per line)."""
+    return Path(settings.DATA_DIR) / "invite_redemptions.jsonl"
+
+
+def _get_legacy_redemptions_file() -> Path:
+    """Get the pre-JSONL redemptions file path (a single JSON array)."""
+    return Path(settings.DATA_DIR) / "invite_redemptions.json"
+
+
+def _migrate_legacy_redemptions() -> None:
+    """
+    Copy redemptions from the old JSON array file into the JSONL log.
+
+    Runs once per data directory; later calls return immediately. The
+    legacy file is left in place for scripts/migrate_to_supabase.py, and
+    entries already in the log are skipped, so repeated runs never
+    duplicate redemptions.
+    """
+    global _legacy_redemptions_checked
+    legacy_file = _get_legacy_redemptions_file()
+    if _legacy_redemptions_checked == legacy_file:
+        return
+    with _legacy_redemptions_lock:
+        if _legacy_redemptions_checked == legacy_file:
+            return
+        if legacy_file.exists():
+            try:
+                redemptions_file = _get_redemptions_file()
+                existing = list(iter_json_lines(redemptions_file)) if redemptions_file.exists() else []
+                seen = {(r["code"], r["email"], r["redeemed_at"]) for r in existing}
+                legacy = [r for r in read_json(legacy_file) if (r["code"], r["email"], r["redeemed_at"]) not in seen]
+                if legacy:
+                    write_json_lines(redemptions_file, legacy + existing)
+                    logger.info(f"Migrated {len(legacy)} invite redemptions to {redemptions_file.name}")
+            except Exception as e:
+                logger.error(f"Error migrating redemptions: {e}")
+                return
+        _legacy_redemptions_checked = legacy_file
 
 
 def _load_invites() -> Dict[str, dict]:
@@ -36,8 +76,7 @@ def _load_invites() -> Dict[str, dict]:
     if not invites_file.exists():
         return {}
     try:
-        with open(invites_file, 'r') as f:
-            return json.load(f)
+        return read_json(invites_file)
     except Exception as e:
         logger.error(f"Error loading invites: {e}")
         return {}
@@ -46,28 +85,27 @@ def _load_invites() -> Dict[str, dict]:
 def _save_invites(invites: Dict[str, dict]) -> None:
     """Save all invite codes to storage."""
     invites_file = _get_invites_file()
-    with open(invites_file, 'w') as f:
-        json.dump(invites, f, indent=2, default=str)
+    write_json(invites_file, invites)
 
 
 def _load_redemptions() -> List[dict]:
     """Load all redemptions from storage."""
+    _migrate_legacy_redemptions()
     redemptions_file = _get_redemptions_file()
     if not redemptions_file.exists():
         return []
     try:
-        with open(redemptions_file, 'r') as f:
-            return json.load(f)
+        # Skips a torn final line rather than hiding every redemption
+        return list(iter_json_lines(redemptions_file))
     except Exception as e:
         logger.error(f"Error loading redemptions: {e}")
         return []
 
 
-def _save_redemptions(redemptions: List[dict]) -> None:
-    """Save all redemptions to storage."""
-    redemptions_file = _get_redemptions_file()
-    with open(redemptions_file, 'w') as f:
-        json.dump(redemptions, f, indent=2, default=str)
+def _record_redemption(redemption: dict) -> None:
+    """Append one redemption to the log without rewriting earlier ones."""
+    _migrate_legacy_redemptions()
+    append_json_line(_get_redemptions_file(), redemption)
 
 
 def generate_code(prefix: str = "MEAL") -> str:
@@ -131,10 +169,7 @@ def create_invite(
     )
     
     # Save
-    invites[code] = invite.model_dump()
-    invites[code]["created_at"] = invite.created_at.isoformat()
-    if invite.expires_at:
-        invites[code]["expires_at"] = invite.expires_at.isoformat()
+    invites[code] = invite.model_dump(mode="json")
     _save_invites(invites)
     
     logger.info(f"Created invite code: {code}")
@@ -149,13 +184,8 @@ def get_invite(code: str) -> Optional[InviteCode]:
     if code not in invites:
         return None
     
-    data = invites[code]
-    # Parse datetime strings
-    data["created_at"] = datetime.fromisoformat(data["created_at"])
-    if data.get("expires_at"):
-        data["expires_at"] = datetime.fromisoformat(data["expires_at"])
-    
-    return InviteCode(**data)
+    # model_validate parses the stored ISO datetime strings
+    return InviteCode.model_validate(invites[code])
 
 
 def validate_and_use_invite(code: str, email: str) -> Tuple[bool, str]:
@@ -189,13 +219,11 @@ def validate_and_use_invite(code: str, email: str) -> Tuple[bool, str]:
     _save_invites(invites)
     
     # Log redemption
-    redemptions = _load_redemptions()
-    redemptions.append({
+    _record_redemption({
         "code": invite.code,
         "email": email,
         "redeemed_at": datetime.now(timezone.utc).isoformat()
     })
-    _save_redemptions(redemptions)
     
     logger.info(f"Invite code {code} redeemed by {email}")
     return True, "Invite code accepted"
@@ -207,10 +235,7 @@ def list_invites(include_disabled: bool = False) -> List[InviteCode]:
     result = []
     
     for data in invites.values():
-        data["created_at"] = datetime.fromisoformat(data["created_at"])
-        if data.get("expires_at"):
-            data["expires_at"] = datetime.fromisoformat(data["expires_at"])
-        invite = InviteCode(**data)
+        invite = InviteCode.model_validate(data)
         if include_disabled or not invite.disabled:
             result.append(invite)
     
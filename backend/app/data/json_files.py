@@ -0,0 +1,121 @@
+"""
+JSON file helpers for the file-backed stores (invite codes, users) and the
+JSONL request, API call and onboarding logs.
+
+Uses orjson, which parses and serializes in C straight from/to bytes, so a
+file is read or written in a single call with no text-mode decoding layer.
+"""
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import orjson
+
+
+def _file_mode(path: Path) -> int:
+    """Permission bits for rewriting path: its current mode, else the umask default."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """
+    Write to a uniquely named temporary file beside path, then swap it in
+    with os.replace.
+
+    Each call gets its own temporary file, so concurrent writers never
+    write into or replace each other's half-written file; the last replace
+    wins. The temporary file is removed if the write or replace fails.
+    mkstemp creates files owner-only, so the target's existing mode (or
+    the umask default for a new file) is applied before the swap.
+    """
+    try:
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.chmod(tmp_name, _file_mode(path))
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file."""
+    return orjson.loads(path.read_bytes())
+
+
+def write_json(path: Path, data: Any, indent: bool = True) -> None:
+    """
+    Write data as JSON; values orjson can't serialize are stored via str().
+
+    Files people may open by hand are indented. Machine-only files pass
+    indent=False for compact output, which is smaller and quicker to
+    write and parse.
+
+    The data goes to a temporary file that then replaces the target, so a
+    crash mid-write leaves the previous contents rather than a truncated
+    file. The parent directory is created on first write, so readers never
+    need to create it.
+    """
+    payload = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if indent else None)
+    _atomic_write_bytes(path, payload)
+
+
+def _parse_json_lines(lines: Iterable[bytes]) -> Iterator[Any]:
+    for line in lines:
+        try:
+            yield orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+
+
+def iter_json_lines(path: Path, reverse: bool = False) -> Iterator[Any]:
+    """
+    Yield each value in a JSONL file, skipping blank and malformed lines.
+
+    Lines are read as bytes and handed straight to orjson, with no text
+    decoding or per-line strip(). With reverse=True the file is read in one
+    call and yielded newest line first.
+    """
+    if reverse:
+        yield from _parse_json_lines(reversed(path.read_bytes().splitlines()))
+        return
+    with open(path, "rb") as f:
+        yield from _parse_json_lines(f)
+
+
+def write_json_lines(path: Path, entries: Iterable[Any]) -> None:
+    """Write a whole JSONL file atomically (see write_json)."""
+    payload = b"".join(orjson.dumps(entry, default=str) + b"\n" for entry in entries)
+    _atomic_write_bytes(path, payload)
+
+
+def append_json_line(path: Path, entry: Any) -> None:
+    """
+    Append one JSON object as a line to a JSONL file.
+
+    Runs on every logged request, so the parent directory is only created
+    when an append finds it missing instead of being mkdir'd on each call.
+    """
+    line = orjson.dumps(entry, default=str) + b"\n"
+    try:
+        f = open(path, "ab")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(path, "ab")
+    with f:
+        f.write(line)
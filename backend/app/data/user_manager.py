@@ -3,30 +3,31 @@ User data management for authentication.
 
 Stores users in JSON files under data/users/.
 """
-import json
 import logging
 import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 from app.config import settings
+from app.data.json_files import read_json, write_json
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; both run on every login
+_NON_ALNUM = re.compile(r'[^a-zA-Z0-9]')
+_NON_ALNUM_RUNS = re.compile(r'[^a-z0-9]+')
+
 
 def _get_users_dir() -> Path:
-    """Get the users data directory."""
-    data_dir = Path(settings.DATA_DIR)
-    users_dir = data_dir / "users"
-    users_dir.mkdir(parents=True, exist_ok=True)
-    return users_dir
+    """Get the users data directory (created on first save)."""
+    return Path(settings.DATA_DIR) / "users"
 
 
 def _email_to_filename(email: str) -> str:
     """Convert email to safe filename."""
     # Replace @ and . with underscores, lowercase
-    safe_name = re.sub(r'[^a-zA-Z0-9]', '_', email.lower())
+    safe_name = _NON_ALNUM.sub('_', email.lower())
     return f"{safe_name}.json"
 
 
@@ -37,10 +38,8 @@ def _email_to_workspace_id(email: str) -> str:
     """
     # Get username part of email
     username = email.split("@")[0].lower()
-    # Replace non-alphanumeric with hyphens
-    workspace_id = re.sub(r'[^a-z0-9]', '-', username)
-    # Remove leading/trailing hyphens and collapse multiple hyphens
-    workspace_id = re.sub(r'-+', '-', workspace_id).strip('-')
+    # Replace each run of non-alphanumerics with one hyphen, trim the ends
+    workspace_id = _NON_ALNUM_RUNS.sub('-', username).strip('-')
     return workspace_id or "user"
 
 
@@ -61,9 +60,7 @@ def get_user_by_email(email: str) -> Optional[User]:
         return None
 
     try:
-        with open(user_file, 'r') as f:
-            data = json.load(f)
-        return User(**data)
+        return User.model_validate(read_json(user_file))
     except Exception as e:
         logger.error(f"Error loading user {email}: {e}")
         return None
@@ -104,14 +101,8 @@ def save_user(user: User) -> None:
     users_dir = _get_users_dir()
     user_file = users_dir / _email_to_filename(user.email)
 
-    data = user.model_dump()
-    # Convert datetime to ISO strings for JSON
-    data["created_at"] = user.created_at.isoformat()
-    if user.last_login:
-        data["last_login"] = user.last_login.isoformat()
-
-    with open(user_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    # mode="json" emits datetimes as ISO strings in the same pass
+    write_json(user_file, user.model_dump(mode="json"))
 
     logger.debug(f"Saved user: {user.email}")
 
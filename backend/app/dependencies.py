@@ -8,7 +8,6 @@ import logging
 from typing import Optional
 from fastapi import Header, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt, JWTError
 from app.config import settings
 from app.db.supabase_client import get_supabase_admin_client
 
@@ -8,8 +8,11 @@ This is the main application file that sets up:
 - API routes
 """
 import logging
+import threading
+from contextlib import asynccontextmanager
 from typing import Optional
 from fastapi import FastAPI, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.dependencies import verify_admin
@@ -21,13 +24,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the pooled Resend client for the app's event loop, and preload
+    Chroma and the embedding model in the background when CHROMA_WARMUP
+    is set.
+    """
+    from app.auth.magic_link import open_resend_client, close_resend_client
+
+    if settings.CHROMA_WARMUP:
+        from app.data.chroma_manager import warmup
+
+        # Off the event loop so /health answers while the model loads
+        threading.Thread(target=warmup, name="chroma-warmup", daemon=True).start()
+    await open_resend_client()
+    try:
+        yield
+    finally:
+        await close_resend_client()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Meal Planner API",
     description="RAG-powered meal planning with household constraints",
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    # Serialize response bodies (recipe lists, meal plans) with orjson
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
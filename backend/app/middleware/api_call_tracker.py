@@ -7,13 +7,14 @@ Tracks each call to external APIs:
 
 Stores counts in a JSONL file and provides aggregation functions.
 """
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Literal
 from collections import defaultdict
 
+from app.data.json_files import append_json_line, iter_json_lines
+
 logger = logging.getLogger(__name__)
 
 # Log file location
@@ -56,9 +57,7 @@ def log_api_call(
     }
 
     try:
-        DATA_DIR.mkdir(exist_ok=True)
-        with open(API_CALLS_LOG_FILE, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        append_json_line(API_CALLS_LOG_FILE, entry)
     except Exception as e:
         logger.error(f"Failed to write API call log: {e}")
 
@@ -84,33 +83,27 @@ def get_workspace_api_stats(workspace_id: str) -> dict:
         if not API_CALLS_LOG_FILE.exists():
             return dict(stats)
 
-        with open(API_CALLS_LOG_FILE, "r") as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    if entry.get("workspace_id") != workspace_id:
-                        continue
-
-                    provider = entry.get("provider")
-                    operation = entry.get("operation", "unknown")
-
-                    if provider == "claude":
-                        stats["claude_calls"] += 1
-                        if entry.get("error"):
-                            stats["claude_errors"] += 1
-                        if entry.get("input_tokens"):
-                            stats["claude_input_tokens"] += entry["input_tokens"]
-                        if entry.get("output_tokens"):
-                            stats["claude_output_tokens"] += entry["output_tokens"]
-                    elif provider == "openai":
-                        stats["openai_calls"] += 1
-                        if entry.get("error"):
-                            stats["openai_errors"] += 1
-
-                    stats["operations"][f"{provider}:{operation}"] += 1
-
-                except json.JSONDecodeError:
-                    continue
+        for entry in iter_json_lines(API_CALLS_LOG_FILE):
+            if entry.get("workspace_id") != workspace_id:
+                continue
+
+            provider = entry.get("provider")
+            operation = entry.get("operation", "unknown")
+
+            if provider == "claude":
+                stats["claude_calls"] += 1
+                if entry.get("error"):
+                    stats["claude_errors"] += 1
+                if entry.get("input_tokens"):
+                    stats["claude_input_tokens"] += entry["input_tokens"]
+                if entry.get("output_tokens"):
+                    stats["claude_output_tokens"] += entry["output_tokens"]
+            elif provider == "openai":
+                stats["openai_calls"] += 1
+                if entry.get("error"):
+                    stats["openai_errors"] += 1
+
+            stats["operations"][f"{provider}:{operation}"] += 1
 
     except Exception as e:
         logger.error(f"Failed to compute API call stats: {e}")
@@ -140,26 +133,20 @@ def get_all_api_stats() -> dict:
             totals["by_workspace"] = {}
             return totals
 
-        with open(API_CALLS_LOG_FILE, "r") as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    provider = entry.get("provider")
-                    ws = entry.get("workspace_id", "unknown")
-
-                    if provider == "claude":
-                        totals["claude_calls"] += 1
-                        totals["by_workspace"][ws]["claude"] += 1
-                        if entry.get("error"):
-                            totals["claude_errors"] += 1
-                    elif provider == "openai":
-                        totals["openai_calls"] += 1
-                        totals["by_workspace"][ws]["openai"] += 1
-                        if entry.get("error"):
-                            totals["openai_errors"] += 1
-
-                except json.JSONDecodeError:
-                    continue
+        for entry in iter_json_lines(API_CALLS_LOG_FILE):
+            provider = entry.get("provider")
+            ws = entry.get("workspace_id", "unknown")
+
+            if provider == "claude":
+                totals["claude_calls"] += 1
+                totals["by_workspace"][ws]["claude"] += 1
+                if entry.get("error"):
+                    totals["claude_errors"] += 1
+            elif provider == "openai":
+                totals["openai_calls"] += 1
+                totals["by_workspace"][ws]["openai"] += 1
+                if entry.get("error"):
+                    totals["openai_errors"] += 1
 
     except Exception as e:
         logger.error(f"Failed to compute total API stats: {e}")
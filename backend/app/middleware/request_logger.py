@@ -6,7 +6,6 @@ Logs each request to a JSONL file with:
 - status_code, duration_ms
 - error (if any)
 """
-import json
 import logging
 import time
 from datetime import datetime
@@ -14,10 +13,13 @@ from pathlib import Path
 from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
+import orjson
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
+from app.data.json_files import append_json_line, iter_json_lines, read_json, write_json
+
 logger = logging.getLogger(__name__)
 
 # Log file location
@@ -44,9 +46,7 @@ def _extract_workspace_id(request: Request) -> Optional[str]:
 def _write_log_entry(entry: dict) -> None:
     """Append a log entry to the JSONL file."""
     try:
-        DATA_DIR.mkdir(exist_ok=True)
-        with open(REQUEST_LOG_FILE, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        append_json_line(REQUEST_LOG_FILE, entry)
     except Exception as e:
         logger.error(f"Failed to write request log: {e}")
 
@@ -56,17 +56,14 @@ def _load_acknowledged_errors() -> dict:
     if not ACKNOWLEDGED_ERRORS_FILE.exists():
         return {}
     try:
-        with open(ACKNOWLEDGED_ERRORS_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        return read_json(ACKNOWLEDGED_ERRORS_FILE)
+    except (orjson.JSONDecodeError, IOError):
         return {}
 
 
 def _save_acknowledged_errors(data: dict) -> None:
-    """Save the acknowledged errors tracking file."""
-    DATA_DIR.mkdir(exist_ok=True)
-    with open(ACKNOWLEDGED_ERRORS_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    """Save the acknowledged errors tracking file (write_json creates DATA_DIR)."""
+    write_json(ACKNOWLEDGED_ERRORS_FILE, data, indent=False)
 
 
 def clear_errors_for_workspace(workspace_id: str) -> dict:
@@ -110,31 +107,24 @@ def get_errors_for_workspace(
         return []
 
     try:
-        with open(REQUEST_LOG_FILE, "r") as f:
-            lines = f.readlines()
-
-        for line in reversed(lines):
+        for entry in iter_json_lines(REQUEST_LOG_FILE, reverse=True):
             if len(entries) >= limit:
                 break
-            try:
-                entry = json.loads(line.strip())
-                if entry.get("workspace_id") != workspace_id:
-                    continue
-                if not entry.get("error"):
-                    continue
-
-                is_acknowledged = (
-                    cleared_before is not None
-                    and entry.get("timestamp", "") <= cleared_before
-                )
+            if entry.get("workspace_id") != workspace_id:
+                continue
+            if not entry.get("error"):
+                continue
 
-                if not include_acknowledged and is_acknowledged:
-                    continue
+            is_acknowledged = (
+                cleared_before is not None
+                and entry.get("timestamp", "") <= cleared_before
+            )
 
-                entry["acknowledged"] = is_acknowledged
-                entries.append(entry)
-            except json.JSONDecodeError:
+            if not include_acknowledged and is_acknowledged:
                 continue
+
+            entry["acknowledged"] = is_acknowledged
+            entries.append(entry)
     except Exception as e:
         logger.error(f"Failed to read errors for workspace: {e}")
 
@@ -163,22 +153,15 @@ def get_recent_requests(
             return []
 
         # Read file in reverse order (most recent first)
-        with open(REQUEST_LOG_FILE, "r") as f:
-            lines = f.readlines()
-
-        for line in reversed(lines):
+        for entry in iter_json_lines(REQUEST_LOG_FILE, reverse=True):
             if len(entries) >= limit:
                 break
-            try:
-                entry = json.loads(line.strip())
-                # Apply filters
-                if workspace_id and entry.get("workspace_id") != workspace_id:
-                    continue
-                if errors_only and not entry.get("error"):
-                    continue
-                entries.append(entry)
-            except json.JSONDecodeError:
+            # Apply filters
+            if workspace_id and entry.get("workspace_id") != workspace_id:
+                continue
+            if errors_only and not entry.get("error"):
                 continue
+            entries.append(entry)
 
     except Exception as e:
         logger.error(f"Failed to read request log: {e}")
@@ -211,36 +194,30 @@ def get_workspace_request_stats(workspace_id: str) -> dict:
         if not REQUEST_LOG_FILE.exists():
             return stats
 
-        with open(REQUEST_LOG_FILE, "r") as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    if entry.get("workspace_id") != workspace_id:
-                        continue
-
-                    stats["total_requests"] += 1
-                    if entry.get("error"):
-                        stats["error_count"] += 1
-                        # Check if this error is unacknowledged
-                        ts = entry.get("timestamp", "")
-                        if cleared_before is None or ts > cleared_before:
-                            stats["unacknowledged_error_count"] += 1
-
-                    # Track last request
-                    ts = entry.get("timestamp")
-                    if ts and (stats["last_request"] is None or ts > stats["last_request"]):
-                        stats["last_request"] = ts
-
-                    # Track endpoint breakdown
-                    endpoint = f"{entry.get('method', 'GET')} {entry.get('path', '/')}"
-                    if endpoint not in stats["endpoints"]:
-                        stats["endpoints"][endpoint] = {"count": 0, "errors": 0}
-                    stats["endpoints"][endpoint]["count"] += 1
-                    if entry.get("error"):
-                        stats["endpoints"][endpoint]["errors"] += 1
-
-                except json.JSONDecodeError:
-                    continue
+        for entry in iter_json_lines(REQUEST_LOG_FILE):
+            if entry.get("workspace_id") != workspace_id:
+                continue
+
+            stats["total_requests"] += 1
+            if entry.get("error"):
+                stats["error_count"] += 1
+                # Check if this error is unacknowledged
+                ts = entry.get("timestamp", "")
+                if cleared_before is None or ts > cleared_before:
+                    stats["unacknowledged_error_count"] += 1
+
+            # Track last request
+            ts = entry.get("timestamp")
+            if ts and (stats["last_request"] is None or ts > stats["last_request"]):
+                stats["last_request"] = ts
+
+            # Track endpoint breakdown
+            endpoint = f"{entry.get('method', 'GET')} {entry.get('path', '/')}"
+            if endpoint not in stats["endpoints"]:
+                stats["endpoints"][endpoint] = {"count": 0, "errors": 0}
+            stats["endpoints"][endpoint]["count"] += 1
+            if entry.get("error"):
+                stats["endpoints"][endpoint]["errors"] += 1
 
     except Exception as e:
         logger.error(f"Failed to compute request stats: {e}")
@@ -274,13 +251,11 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):
             # For error responses, capture the response body
             if status_code >= 400:
                 # Read the response body
-                body_bytes = b""
-                async for chunk in response.body_iterator:
-                    body_bytes += chunk
+                body_bytes = b"".join([chunk async for chunk in response.body_iterator])
 
                 # Try to parse as JSON for cleaner error message
                 try:
-                    body_json = json.loads(body_bytes.decode("utf-8"))
+                    body_json = orjson.loads(body_bytes)
                     # Extract 'detail' field if present (FastAPI standard)
                     if isinstance(body_json, dict) and "detail" in body_json:
                         error_msg = body_json["detail"]
@@ -291,7 +266,7 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):
                             )
                     else:
                         error_msg = body_bytes.decode("utf-8")[:500]
-                except (json.JSONDecodeError, UnicodeDecodeError):
+                except (orjson.JSONDecodeError, UnicodeDecodeError):
                     error_msg = body_bytes.decode("utf-8", errors="replace")[:500]
 
                 response_body = body_bytes.decode("utf-8", errors="replace")[:1000]
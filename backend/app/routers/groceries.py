@@ -305,7 +305,7 @@ async def parse_voice_input(
 
         # Convert dicts to ProposedGroceryItem models
         return VoiceParseResponse(
-            proposed_items=[ProposedGroceryItem(**item) for item in proposed_items],
+            proposed_items=[ProposedGroceryItem.model_validate(item) for item in proposed_items],
             transcription_used=request.transcription,
             warnings=warnings
         )
@@ -537,8 +537,8 @@ async def parse_receipt(
         # For simplicity, we'll leave it None for now (can enhance later)
 
         return ReceiptParseResponse(
-            proposed_items=[ProposedGroceryItem(**item) for item in proposed_items],
-            excluded_items=[ExcludedReceiptItem(**item) for item in excluded_items],
+            proposed_items=[ProposedGroceryItem.model_validate(item) for item in proposed_items],
+            excluded_items=[ExcludedReceiptItem.model_validate(item) for item in excluded_items],
             detected_purchase_date=detected_purchase_date,
             detected_store=detected_store,
             warnings=warnings
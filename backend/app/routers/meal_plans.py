@@ -24,7 +24,7 @@ from app.services.recipe_filter_service import (
 )
 from app.models.generation_config import GenerationConfig
 from app.models.recipe_readiness import RecipeReadiness
-from app.data.data_manager import list_all_recipes
+from app.data.data_manager import list_recipe_summaries
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +33,10 @@ router = APIRouter(
     tags=["meal-plans"]
 )
 
+# Endpoints that save plans are plain def: their whole load-modify-save
+# sequence uses the blocking Supabase client, so FastAPI runs them in its
+# threadpool instead of on the event loop.
+
 
 class GenerateMealPlanRequest(BaseModel):
     """Request body for generating a meal plan"""
@@ -96,7 +100,7 @@ class DeleteMealRequest(BaseModel):
 
 
 @router.post("/generate", response_model=MealPlan)
-async def generate_meal_plan_endpoint(
+def generate_meal_plan_endpoint(
     request: GenerateMealPlanRequest,
     workspace_id: str = Query(..., description="Workspace identifier")
 ):
@@ -210,8 +214,8 @@ async def check_readiness_endpoint(
     """
     logger.info(f"Checking recipe readiness for workspace '{workspace_id}'")
 
-    # Load all recipes for the workspace
-    recipes = list_all_recipes(workspace_id)
+    # Only meal types are needed, so skip loading full recipes
+    recipes = list_recipe_summaries(workspace_id)
 
     # Count recipes by meal type
     counts = {
@@ -223,7 +227,7 @@ async def check_readiness_endpoint(
     }
 
     for recipe in recipes:
-        for meal_type in recipe.meal_types:
+        for meal_type in recipe.get("meal_types") or []:
             if meal_type in counts:
                 counts[meal_type] += 1
 
@@ -311,7 +315,7 @@ async def list_meal_plan_weeks_endpoint(
 # ===== Swap & Undo Endpoints =====
 
 @router.patch("/{meal_plan_id}", response_model=MealPlan)
-async def swap_meal_endpoint(
+def swap_meal_endpoint(
     meal_plan_id: str,
     request: SwapMealRequest,
     workspace_id: str = Query(..., description="Workspace identifier")
@@ -383,7 +387,7 @@ async def swap_meal_endpoint(
 
 
 @router.post("/{meal_plan_id}/undo-swap", response_model=MealPlan)
-async def undo_swap_endpoint(
+def undo_swap_endpoint(
     meal_plan_id: str,
     request: UndoSwapRequest,
     workspace_id: str = Query(..., description="Workspace identifier")
@@ -464,7 +468,7 @@ async def undo_swap_endpoint(
 # ===== Move, Add, Delete Meal Endpoints (for drag-and-drop) =====
 
 @router.post("/{meal_plan_id}/move-meal", response_model=MealPlan)
-async def move_meal_endpoint(
+def move_meal_endpoint(
     meal_plan_id: str,
     request: MoveMealRequest,
     workspace_id: str = Query(..., description="Workspace identifier")
@@ -546,7 +550,7 @@ async def move_meal_endpoint(
 
 
 @router.post("/{meal_plan_id}/add-meal", response_model=MealPlan)
-async def add_meal_endpoint(
+def add_meal_endpoint(
     meal_plan_id: str,
     request: AddMealRequest,
     workspace_id: str = Query(..., description="Workspace identifier")
@@ -606,7 +610,7 @@ async def add_meal_endpoint(
 
 
 @router.post("/{meal_plan_id}/delete-meal", response_model=MealPlan)
-async def delete_meal_endpoint(
+def delete_meal_endpoint(
     meal_plan_id: str,
     request: DeleteMealRequest,
     workspace_id: str = Query(..., description="Workspace identifier")
@@ -715,7 +719,7 @@ async def get_meal_plan_endpoint(
 
 
 @router.post("", response_model=MealPlan, status_code=201)
-async def save_meal_plan_endpoint(
+def save_meal_plan_endpoint(
     meal_plan: MealPlan,
     workspace_id: str = Query(..., description="Workspace identifier")
 ):
@@ -740,7 +744,7 @@ async def save_meal_plan_endpoint(
 
 
 @router.delete("/{meal_plan_id}", status_code=204)
-async def delete_meal_plan_endpoint(
+def delete_meal_plan_endpoint(
     meal_plan_id: str,
     workspace_id: str = Query(..., description="Workspace identifier")
 ):
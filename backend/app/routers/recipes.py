@@ -13,7 +13,7 @@ from app.models.recipe import (
 )
 from app.models.recipe_rating import RecipeRating, RatingUpdate
 from app.data.data_manager import (
-    load_recipe, save_recipe, list_all_recipes, delete_recipe,
+    load_recipe, load_recipes_by_ids, save_recipe, list_all_recipes, list_recipe_summaries, delete_recipe,
     get_recipe_rating, save_recipe_rating, delete_recipe_rating,
     load_recipe_ratings, load_household_profile
 )
@@ -140,12 +140,8 @@ async def get_member_favorites(
         if ratings.get(member_name) == "like"
     ]
 
-    # Load the full recipe objects
-    favorite_recipes = []
-    for recipe_id in liked_recipe_ids:
-        recipe = load_recipe(workspace_id, recipe_id)
-        if recipe:
-            favorite_recipes.append(recipe)
+    # Load the full recipe objects in one query
+    favorite_recipes = load_recipes_by_ids(workspace_id, liked_recipe_ids)
 
     logger.info(f"Found {len(favorite_recipes)} favorites for {member_name} in workspace '{workspace_id}'")
     return favorite_recipes
@@ -204,12 +200,8 @@ async def get_popular_recipes(workspace_id: str = Query(..., description="Worksp
         if all(rating == "like" for rating in all_ratings):
             popular_recipe_ids.append(recipe_id)
 
-    # Load the full recipe objects
-    popular_recipes = []
-    for recipe_id in popular_recipe_ids:
-        recipe = load_recipe(workspace_id, recipe_id)
-        if recipe:
-            popular_recipes.append(recipe)
+    # Load the full recipe objects in one query
+    popular_recipes = load_recipes_by_ids(workspace_id, popular_recipe_ids)
 
     logger.info(f"Found {len(popular_recipes)} popular recipes for workspace '{workspace_id}'")
     return popular_recipes
@@ -369,8 +361,9 @@ async def get_recipe_ratings(
     return ratings
 
 
+# Plain def so the blocking load and save run in FastAPI's threadpool
 @router.post("/{recipe_id}/rating", response_model=Dict[str, Optional[str]])
-async def rate_recipe(
+def rate_recipe(
     recipe_id: str,
     rating_update: RatingUpdate,
     workspace_id: str = Query(..., description="Workspace identifier")
@@ -898,10 +891,10 @@ async def generate_recipe_from_title_endpoint(
             detail="Recipe title is required"
         )
 
-    # Check if a recipe with this title already exists
-    all_recipes = list_all_recipes(workspace_id)
+    # Check if a recipe with this title already exists (titles only, no full recipes)
+    all_recipes = list_recipe_summaries(workspace_id)
     for existing_recipe in all_recipes:
-        if existing_recipe.title.lower() == request.recipe_title.strip().lower():
+        if existing_recipe["title"].lower() == request.recipe_title.strip().lower():
             raise HTTPException(
                 status_code=409,
                 detail=f"A recipe with the title '{request.recipe_title}' already exists"
@@ -1073,8 +1066,9 @@ async def get_cooking_timeline(
     all_equipment = set()
     all_ingredients = []
 
+    recipes_by_id = {recipe.id: recipe for recipe in load_recipes_by_ids(workspace_id, request.recipe_ids)}
     for recipe_id in request.recipe_ids:
-        recipe = load_recipe(workspace_id, recipe_id)
+        recipe = recipes_by_id.get(recipe_id)
         if not recipe:
             raise HTTPException(status_code=404, detail=f"Recipe not found: {recipe_id}")
 
@@ -1197,7 +1191,7 @@ async def migrate_meal_types(
             recipe_dict["meal_types"] = meal_types
 
             # Save updated recipe
-            updated_recipe = Recipe(**recipe_dict)
+            updated_recipe = Recipe.model_validate(recipe_dict)
             save_recipe(workspace_id, updated_recipe)
             stats["updated"] += 1
             logger.info(f"Migrated recipe '{recipe.id}': meal_types={meal_types}")
@@ -13,6 +13,7 @@ import uuid
 from datetime import date as Date, timedelta
 from typing import List, Tuple, Dict, Optional
 from anthropic import Anthropic
+from pydantic import ValidationError
 from app.config import settings
 from app.models.meal_plan import MealPlan
 from app.models.recipe import Recipe, VALID_MEAL_TYPES
@@ -563,16 +564,13 @@ def _parse_meal_plan_response(response_text: str, week_start_date: str) -> Optio
             end = response_text.find("```", start)
             response_text = response_text[start:end].strip()
 
-        # Parse JSON
-        data = json.loads(response_text)
-
-        # Validate and create MealPlan using Pydantic
-        meal_plan = MealPlan(**data)
+        # Parse and validate in one pass with pydantic-core's JSON parser
+        meal_plan = MealPlan.model_validate_json(response_text)
 
         return meal_plan
 
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON from Claude response: {e}")
+    except ValidationError as e:
+        logger.error(f"Failed to parse MealPlan from Claude response: {e}")
         logger.debug(f"Response text: {response_text}")
         return None
     except Exception as e:
@@ -806,7 +804,7 @@ def _parse_generated_recipe_response(response_text: str, meal_type: str = "dinne
             data["meal_types"] = ["dinner"]  # Default to dinner if unknown
 
         # Validate and create Recipe using Pydantic
-        recipe = Recipe(**data)
+        recipe = Recipe.model_validate(data)
 
         return recipe
 
@@ -1749,7 +1747,7 @@ async def parse_recipe_from_url(
 
             # Create Recipe object
             try:
-                recipe = Recipe(**recipe_data)
+                recipe = Recipe.model_validate(recipe_data)
                 logger.info(f"Successfully parsed recipe: '{recipe.title}' with {confidence} confidence")
                 return recipe, confidence, missing_fields, warnings
             except Exception as e:
@@ -2038,7 +2036,7 @@ async def parse_recipe_from_text(
 
             # Create Recipe object
             try:
-                recipe = Recipe(**recipe_data)
+                recipe = Recipe.model_validate(recipe_data)
                 logger.info(f"Successfully parsed recipe from text: '{recipe.title}' with {confidence} confidence")
                 return recipe, confidence, missing_fields, warnings
             except Exception as e:
@@ -10,13 +10,14 @@ Events are logged to:
 1. Application logger (stdout, captured by Railway)
 2. JSONL file (backend/data/onboarding_events.jsonl)
 """
-import json
 import logging
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from app.data.json_files import append_json_line, iter_json_lines
+
 logger = logging.getLogger(__name__)
 
 # Log file for onboarding events
@@ -70,9 +71,7 @@ def log_onboarding_event(
 
     # Write to dedicated onboarding log file
     try:
-        ONBOARDING_LOG_FILE.parent.mkdir(exist_ok=True)
-        with open(ONBOARDING_LOG_FILE, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        append_json_line(ONBOARDING_LOG_FILE, entry)
     except Exception as e:
         logger.error(f"Failed to write onboarding log: {e}")
 
@@ -189,34 +188,25 @@ def get_onboarding_funnel_stats() -> Dict[str, Any]:
     }
 
     try:
-        with open(ONBOARDING_LOG_FILE, "r") as f:
-            entries = []
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                    entries.append(entry)
-                    event = entry.get("event")
-
-                    if event == OnboardingEvent.STARTED.value:
-                        stats["total_started"] += 1
-                    elif event == OnboardingEvent.COMPLETED.value:
-                        stats["total_completed"] += 1
-                    elif event == OnboardingEvent.SKIPPED.value:
-                        stats["total_skipped"] += 1
-                    elif event == OnboardingEvent.ERROR.value:
-                        stats["total_errors"] += 1
-                    elif event == OnboardingEvent.STEP_VIEWED.value:
-                        step_name = entry.get("step_name", f"step_{entry.get('step')}")
-                        stats["step_views"][step_name] = stats["step_views"].get(step_name, 0) + 1
-
-                except json.JSONDecodeError:
-                    continue
-
-            # Get last 10 events for recent activity
-            stats["recent_events"] = entries[-10:] if entries else []
+        entries = []
+        for entry in iter_json_lines(ONBOARDING_LOG_FILE):
+            entries.append(entry)
+            event = entry.get("event")
+
+            if event == OnboardingEvent.STARTED.value:
+                stats["total_started"] += 1
+            elif event == OnboardingEvent.COMPLETED.value:
+                stats["total_completed"] += 1
+            elif event == OnboardingEvent.SKIPPED.value:
+                stats["total_skipped"] += 1
+            elif event == OnboardingEvent.ERROR.value:
+                stats["total_errors"] += 1
+            elif event == OnboardingEvent.STEP_VIEWED.value:
+                step_name = entry.get("step_name", f"step_{entry.get('step')}")
+                stats["step_views"][step_name] = stats["step_views"].get(step_name, 0) + 1
+
+        # Get last 10 events for recent activity
+        stats["recent_events"] = entries[-10:] if entries else []
 
         # Calculate rates
         if stats["total_started"] > 0:
@@ -93,10 +93,7 @@ async def upload_photo(file_data: bytes, filename: str, workspace_id: str) -> st
             raise
 
     else:
-        # Local filesystem fallback
-        local_dir = LOCAL_PHOTO_DIR / workspace_id
-        local_dir.mkdir(parents=True, exist_ok=True)
-
+        # Local filesystem fallback (the key's parent is the workspace dir)
         local_path = LOCAL_PHOTO_DIR / key.replace("recipes/", "")
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
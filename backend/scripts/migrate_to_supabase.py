@@ -82,6 +82,20 @@ def load_json_file(filepath: Path) -> Optional[Dict]:
         return None
 
 
+def load_json_lines_file(filepath: Path) -> List[Dict]:
+    """Load a JSONL file, skipping malformed lines; empty if it doesn't exist."""
+    if not filepath.exists():
+        return []
+    entries = []
+    with open(filepath, 'r') as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return entries
+
+
 def migrate_household_profile(supabase: Client, workspace_id: str) -> bool:
     """Migrate household profile for a workspace."""
     filepath = DATA_DIR / workspace_id / "household_profile.json"
@@ -297,12 +311,18 @@ def migrate_invites(supabase: Client) -> int:
 
     logger.info(f"Migrated {invite_count} invite codes")
 
-    # Migrate invite redemptions
-    redemptions_file = DATA_DIR / "invite_redemptions.json"
-    redemptions_data = load_json_file(redemptions_file)
+    # Migrate invite redemptions: the JSONL log, plus any legacy JSON array
+    # entries the app hasn't copied into it yet
+    legacy_data = load_json_file(DATA_DIR / "invite_redemptions.json")
+    redemptions_data = load_json_lines_file(DATA_DIR / "invite_redemptions.jsonl")
+    if isinstance(legacy_data, list):
+        seen = {(r.get("code"), r.get("email"), r.get("redeemed_at")) for r in redemptions_data}
+        redemptions_data = [
+            r for r in legacy_data if (r.get("code"), r.get("email"), r.get("redeemed_at")) not in seen
+        ] + redemptions_data
     redemption_count = 0
 
-    if redemptions_data and isinstance(redemptions_data, list):
+    if redemptions_data:
         for redemption in redemptions_data:
             try:
                 record = {
@@ -6,7 +6,7 @@ This script:
 1. Checks for data files at the root of DATA_DIR (old structure)
 2. Creates a workspace directory (default: 'andrea')
 3. Moves existing files to the workspace directory
-4. Updates Chroma database to add workspace_id metadata to existing recipes
+4. Moves legacy Chroma recipes without a workspace into this workspace's collection
 
 Usage:
     python scripts/migrate_to_workspace.py [workspace_id]
@@ -24,7 +24,7 @@ import json
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.config import settings
-from app.data.chroma_manager import get_recipes_collection
+from app.data.chroma_manager import initialize_chroma, migrate_legacy_collection
 
 def migrate_to_workspace(workspace_id: str = "andrea"):
     """Migrate existing data to a workspace directory."""
@@ -93,79 +93,11 @@ def migrate_to_workspace(workspace_id: str = "andrea"):
 
     print(f"\n✓ Migrated {migrated_count} files/items")
 
-    # Update Chroma database
+    # Move Chroma embeddings into the workspace's collection
     print(f"\n🗄️  Updating Chroma database...")
     try:
-        collection = get_recipes_collection()
-
-        # Get all existing documents
-        all_docs = collection.get()
-
-        if not all_docs['ids']:
-            print("  No recipes found in Chroma database")
-        else:
-            print(f"  Found {len(all_docs['ids'])} recipes in Chroma")
-
-            # Check if any recipes already have workspace_id
-            has_workspace = any(
-                doc.get('workspace_id') for doc in all_docs.get('metadatas', [])
-            )
-
-            if has_workspace:
-                print(f"  ⚠️  Some recipes already have workspace_id metadata")
-                response = input(f"  Update all recipes to workspace '{workspace_id}'? (y/N): ")
-                if response.lower() != 'y':
-                    print("  Skipping Chroma update")
-                    return
-
-            # Update all recipes to have workspace_id
-            updated_metadatas = []
-            updated_ids = []
-
-            for doc_id, metadata in zip(all_docs['ids'], all_docs['metadatas']):
-                # If ID already has workspace prefix, skip
-                if ':' in doc_id:
-                    print(f"  Skipping {doc_id} (already has workspace prefix)")
-                    continue
-
-                # Update metadata to include workspace_id
-                updated_metadata = metadata.copy() if metadata else {}
-                updated_metadata['workspace_id'] = workspace_id
-
-                # Create new ID with workspace prefix
-                new_id = f"{workspace_id}:{doc_id}"
-
-                updated_metadatas.append(updated_metadata)
-                updated_ids.append((doc_id, new_id))
-
-            if not updated_ids:
-                print("  No recipes to update (all already have workspace)")
-            else:
-                # Note: ChromaDB doesn't support ID updates directly
-                # We need to delete old entries and add new ones
-                print(f"  Updating {len(updated_ids)} recipes...")
-
-                for i, (old_id, new_id) in enumerate(updated_ids):
-                    # Get the full document
-                    doc = collection.get(ids=[old_id])
-
-                    if doc['ids']:
-                        # Add with new ID and updated metadata
-                        collection.add(
-                            ids=[new_id],
-                            documents=doc['documents'],
-                            metadatas=[updated_metadatas[i]],
-                            embeddings=doc['embeddings'][0] if doc.get('embeddings') else None
-                        )
-
-                        # Delete old entry
-                        collection.delete(ids=[old_id])
-
-                        if (i + 1) % 10 == 0:
-                            print(f"    Updated {i + 1}/{len(updated_ids)} recipes...")
-
-                print(f"  ✓ Updated {len(updated_ids)} recipes in Chroma")
-
+        moved = migrate_legacy_collection(initialize_chroma(), default_workspace_id=workspace_id)
+        print(f"  ✓ Moved {moved} legacy recipes to per-workspace collections")
     except Exception as e:
         print(f"  ❌ Error updating Chroma database: {e}")
         print("  You may need to re-embed recipes for this workspace")
@@ -42,6 +42,26 @@ def temp_data_dir(tmp_path, monkeypatch):
     # Cleanup handled automatically by tmp_path
 
 
+def _redirect_logs(log_dir: Path, monkeypatch) -> None:
+    """Point the request, API call and onboarding logs at log_dir
+
+    These logs live in backend/data/ rather than under DATA_DIR, so test
+    requests would otherwise append to the real files.
+    """
+    from app.middleware import request_logger, api_call_tracker
+    from app.services import onboarding_logger
+    monkeypatch.setattr(request_logger, "REQUEST_LOG_FILE", log_dir / "request_log.jsonl")
+    monkeypatch.setattr(request_logger, "ACKNOWLEDGED_ERRORS_FILE", log_dir / "acknowledged_errors.json")
+    monkeypatch.setattr(api_call_tracker, "API_CALLS_LOG_FILE", log_dir / "api_calls.jsonl")
+    monkeypatch.setattr(onboarding_logger, "ONBOARDING_LOG_FILE", log_dir / "onboarding_events.jsonl")
+
+
+@pytest.fixture(autouse=True)
+def isolated_logs(tmp_path, monkeypatch):
+    """Keeps every test's request and onboarding logs under tmp_path"""
+    _redirect_logs(tmp_path, monkeypatch)
+
+
 @pytest.fixture
 def client(temp_data_dir):
     """Provides FastAPI test client with isolated data directory
@@ -76,6 +96,7 @@ class MockSupabaseQuery:
         self._order_col = None
         self._order_desc = False
         self._limit_val = None
+        self._delete = False
 
     def select(self, *args, count: Optional[str] = None):
         self._select_cols = args[0] if args else "*"
@@ -86,6 +107,10 @@ class MockSupabaseQuery:
         self._filters.append((field, "eq", value))
         return self
 
+    def in_(self, field: str, values: List[Any]):
+        self._filters.append((field, "in", list(values)))
+        return self
+
     def single(self):
         self._single = True
         return self
@@ -105,14 +130,24 @@ class MockSupabaseQuery:
 
         # Apply filters
         results = []
+        matched_keys = []
         for key, record in table_data.items():
             match = True
             for field, op, value in self._filters:
                 if op == "eq" and record.get(field) != value:
                     match = False
                     break
+                if op == "in" and record.get(field) not in value:
+                    match = False
+                    break
             if match:
                 results.append(record)
+                matched_keys.append(key)
+
+        if self._delete:
+            for key in matched_keys:
+                del table_data[key]
+            return MockSupabaseResponse(results)
 
         # Apply ordering
         if self._order_col:
@@ -121,10 +156,18 @@ class MockSupabaseQuery:
                 reverse=self._order_desc
             )
 
+        # count="exact" reports every match, not just the limited page
+        total = len(results)
+
         # Apply limit
         if self._limit_val:
             results = results[:self._limit_val]
 
+        # Return only the selected columns
+        if self._select_cols != "*":
+            columns = [column.strip() for column in self._select_cols.split(",")]
+            results = [{c: record[c] for c in columns if c in record} for record in results]
+
         # Handle single() - raises PGRST116 if no rows
         if self._single:
             if not results:
@@ -133,7 +176,7 @@ class MockSupabaseQuery:
 
         # Handle count mode
         if self._count_mode == "exact":
-            return MockSupabaseResponse(results, count=len(results))
+            return MockSupabaseResponse(results, count=total)
 
         return MockSupabaseResponse(results)
 
@@ -145,24 +188,31 @@ class MockSupabaseQuery:
 
     def delete(self):
         """Delete matching records."""
+        self._delete = True
         return self
 
 
 class MockSupabaseUpsertQuery(MockSupabaseQuery):
     """Query that handles upsert execution."""
 
-    def __init__(self, store: Dict[str, Dict], table_name: str, data: Dict[str, Any], on_conflict: str):
+    def __init__(self, store: Dict[str, Dict], table_name: str, data: Any, on_conflict: str):
         super().__init__(store, table_name)
         self._upsert_data = data
         self._on_conflict = on_conflict
 
     def execute(self) -> MockSupabaseResponse:
-        """Execute upsert - insert or update based on conflict key."""
+        """Execute upsert - insert or update based on conflict key (one row or a list)."""
         table_data = self._store.setdefault(self._table_name, {})
+        rows = self._upsert_data if isinstance(self._upsert_data, list) else [self._upsert_data]
+        conflict_columns = (self._on_conflict or "").split(",")
 
-        # Use conflict key as the record key
-        key = self._upsert_data.get(self._on_conflict, str(len(table_data)))
-        table_data[key] = self._upsert_data.copy()
+        for row in rows:
+            # Use the conflict column value(s) as the record key
+            if len(conflict_columns) > 1:
+                key = ":".join(str(row.get(column)) for column in conflict_columns)
+            else:
+                key = row.get(self._on_conflict, str(len(table_data)))
+            table_data[key] = row.copy()
 
         return MockSupabaseResponse(self._upsert_data)
 
@@ -178,11 +228,11 @@ class MockSupabaseTable:
         query = MockSupabaseQuery(self._store, self._table_name)
         return query.select(*args, count=count)
 
-    def upsert(self, data: Dict[str, Any], on_conflict: str = None):
+    def upsert(self, data: Any, on_conflict: str = None):
         return MockSupabaseUpsertQuery(self._store, self._table_name, data, on_conflict)
 
     def delete(self):
-        return MockSupabaseQuery(self._store, self._table_name)
+        return MockSupabaseQuery(self._store, self._table_name).delete()
 
 
 class MockSupabaseClient:
@@ -219,6 +269,7 @@ def mock_supabase(monkeypatch):
         "meal_plans": {},
         "groceries": {},
         "profiles": {},
+        "recipe_ratings": {},
     }
 
     mock_client = MockSupabaseClient(store)
@@ -245,15 +296,18 @@ def mock_supabase(monkeypatch):
 
 
 @pytest.fixture
-def client_with_mock_supabase(mock_supabase):
+def client_with_mock_supabase(mock_supabase, tmp_path, monkeypatch):
     """
     FastAPI test client with mocked Supabase.
 
     Use this for testing endpoints that interact with Supabase.
     The mock_supabase store is available for pre-populating test data
-    or asserting on stored results.
+    or asserting on stored results. Request and onboarding logs are
+    written under tmp_path; they are redirected again here because
+    mock_supabase re-imports the app modules.
     """
     from app.main import app
+    _redirect_logs(tmp_path, monkeypatch)
 
     with TestClient(app) as test_client:
         yield test_client, mock_supabase
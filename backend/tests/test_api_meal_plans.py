@@ -810,6 +810,26 @@ class TestReadinessEndpoint:
         assert data["counts_by_meal_type"]["snack"] == 0
         assert data["counts_by_meal_type"]["side_dish"] == 0
 
+    def test_readiness_counts_meal_types_from_summaries(self, client_with_mock_supabase):
+        """Test readiness is computed from the workspace's recipe summaries"""
+        client, store = client_with_mock_supabase
+        for recipe_id, meal_types in (("r1", ["breakfast"]), ("r2", ["lunch", "dinner"])):
+            store["recipes"][recipe_id] = {
+                "id": recipe_id, "workspace_id": "test-workspace", "title": recipe_id,
+                "ingredients": ["item"], "instructions": "Cook", "meal_types": meal_types,
+                "prep_time_minutes": 5, "active_cooking_time_minutes": 10, "serves": 2
+            }
+
+        response = client.get(
+            "/meal-plans/readiness",
+            params={"workspace_id": "test-workspace"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["is_ready"] is True
+        assert data["counts_by_meal_type"]["dinner"] == 1
+
 
 class TestMoveMealEndpoint:
     """Test POST /meal-plans/{meal_plan_id}/move-meal endpoint for drag-and-drop"""
@@ -0,0 +1,98 @@
+"""
+API endpoint integration tests for recipe ratings and error responses.
+
+Uses client_with_mock_supabase, so recipes and ratings are seeded straight
+into the in-memory Supabase store.
+"""
+import pytest
+
+
+@pytest.fixture
+def client(client_with_mock_supabase):
+    """FastAPI test client and mock Supabase store"""
+    return client_with_mock_supabase
+
+
+def add_recipe_row(store, workspace_id, recipe_id, title):
+    """Seed a recipe row as the recipes table stores it"""
+    store["recipes"][recipe_id] = {
+        "id": recipe_id,
+        "workspace_id": workspace_id,
+        "title": title,
+        "ingredients": ["rice"],
+        "instructions": "Cook",
+        "tags": ["dinner"],
+        "prep_time_minutes": 5,
+        "active_cooking_time_minutes": 10,
+        "serves": 2,
+        "required_appliances": [],
+        "meal_types": ["dinner"],
+    }
+
+
+def add_rating_row(store, workspace_id, recipe_id, ratings):
+    """Seed a recipe_ratings row keyed like its composite conflict target"""
+    store["recipe_ratings"][f"{workspace_id}:{recipe_id}"] = {
+        "workspace_id": workspace_id,
+        "recipe_id": recipe_id,
+        "ratings": ratings,
+    }
+
+
+# ===== Ratings =====
+
+class TestRateRecipeEndpoint:
+    """Test POST /recipes/{recipe_id}/rating endpoint"""
+
+    def test_rate_recipe_saves_rating(self, client):
+        """Should save a rating and return the recipe's ratings"""
+        client, store = client
+        add_recipe_row(store, "ws1", "r1", "Soup")
+        add_rating_row(store, "ws1", "r1", {"Andrea": "like"})
+
+        response = client.post(
+            "/recipes/r1/rating",
+            params={"workspace_id": "ws1"},
+            json={"member_name": "Sam", "rating": "dislike"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"Andrea": "like", "Sam": "dislike"}
+        assert store["recipe_ratings"]["ws1:r1"]["ratings"] == {"Andrea": "like", "Sam": "dislike"}
+
+
+class TestMemberFavoritesEndpoint:
+    """Test GET /recipes/favorites/{member_name} endpoint"""
+
+    def test_member_favorites_returns_liked_recipes(self, client):
+        """Should return the member's liked recipes that still exist"""
+        client, store = client
+        add_recipe_row(store, "ws1", "r1", "Soup")
+        add_recipe_row(store, "ws1", "r2", "Stew")
+        add_rating_row(store, "ws1", "r1", {"Andrea": "like"})
+        add_rating_row(store, "ws1", "r2", {"Andrea": "dislike"})
+        add_rating_row(store, "ws1", "r3", {"Andrea": "like"})
+
+        response = client.get("/recipes/favorites/Andrea", params={"workspace_id": "ws1"})
+
+        assert response.status_code == 200
+        assert [recipe["id"] for recipe in response.json()] == ["r1"]
+
+
+# ===== Error Responses =====
+
+class TestErrorResponses:
+    """Test error bodies returned by recipe endpoints and their request log entries"""
+
+    def test_error_responses_are_logged_with_detail(self, client):
+        """Should return JSON error bodies and log their detail message"""
+        from app.middleware import request_logger
+
+        client, _ = client
+
+        response = client.get("/recipes/missing", params={"workspace_id": "ws1"})
+
+        assert response.status_code == 404
+        assert response.headers["content-type"] == "application/json"
+        [entry] = request_logger.get_recent_requests()
+        assert entry["error"] == response.json()["detail"]
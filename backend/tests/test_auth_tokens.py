@@ -0,0 +1,231 @@
+"""Tests for JWT session and magic link token handling"""
+import asyncio
+import json
+from datetime import timedelta
+from types import SimpleNamespace
+
+import httpx
+import jwt
+import pytest
+
+from app.auth import jwt_handler, magic_link
+
+
+@pytest.fixture
+def auth_settings(monkeypatch):
+    """Point both auth modules at a settings object with a test secret"""
+    test_settings = SimpleNamespace(
+        JWT_SECRET_KEY="test-secret",
+        JWT_EXPIRATION_HOURS=24,
+        RESEND_API_KEY="",
+    )
+    monkeypatch.setattr(jwt_handler, "settings", test_settings)
+    monkeypatch.setattr(magic_link, "settings", test_settings)
+    jwt_handler.clear_access_token_cache()
+    yield test_settings
+    jwt_handler.clear_access_token_cache()
+
+
+def test_access_token_round_trip(auth_settings):
+    """Should decode an access token back to its claims"""
+    token = jwt_handler.create_access_token("cook@example.com", "ws-1")
+    payload = jwt_handler.decode_access_token(token)
+
+    assert payload["sub"] == "cook@example.com"
+    assert payload["workspace_id"] == "ws-1"
+    assert payload["type"] == "access"
+    assert payload["exp"] - payload["iat"] == 24 * 3600
+
+
+def test_access_token_custom_expiry(auth_settings):
+    """Should honour an explicit expires_delta"""
+    token = jwt_handler.create_access_token("cook@example.com", "ws-1", timedelta(minutes=5))
+    payload = jwt_handler.decode_access_token(token)
+
+    assert payload["exp"] - payload["iat"] == 300
+
+
+def test_expired_access_token_rejected(auth_settings):
+    """Should return None for an expired token"""
+    token = jwt_handler.create_access_token("cook@example.com", "ws-1", timedelta(seconds=-1))
+
+    assert jwt_handler.decode_access_token(token) is None
+
+
+def test_access_token_wrong_secret_rejected(auth_settings):
+    """Should return None for a token signed with another secret"""
+    token = jwt.encode(
+        {"sub": "cook@example.com", "workspace_id": "ws-1", "type": "access", "iat": 0, "exp": 2**31},
+        "other-secret",
+        algorithm="HS256",
+    )
+
+    assert jwt_handler.decode_access_token(token) is None
+
+
+def test_decode_access_token_caches_verification(auth_settings, monkeypatch):
+    """Should skip jwt.decode for a token that was already verified"""
+    token = jwt_handler.create_access_token("cook@example.com", "ws-1")
+    first = jwt_handler.decode_access_token(token)
+    first["sub"] = "mutated"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("jwt.decode should not be called on a cache hit")
+
+    monkeypatch.setattr(jwt_handler.jwt, "decode", fail)
+
+    assert jwt_handler.decode_access_token(token)["sub"] == "cook@example.com"
+
+
+def test_decode_access_token_cache_respects_token_expiry(auth_settings, monkeypatch):
+    """Should re-verify a cached token once its exp has passed"""
+    token = jwt_handler.create_access_token("cook@example.com", "ws-1", timedelta(seconds=30))
+    assert jwt_handler.decode_access_token(token) is not None
+
+    later = jwt_handler.time.time() + 31
+    monkeypatch.setattr(jwt_handler.time, "time", lambda: later)
+
+    def expired(*args, **kwargs):
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    monkeypatch.setattr(jwt_handler.jwt, "decode", expired)
+
+    assert jwt_handler.decode_access_token(token) is None
+
+
+def test_magic_link_token_not_accepted_as_access_token(auth_settings):
+    """Should keep magic link and access tokens from being interchangeable"""
+    magic_token = magic_link.create_magic_link_token("cook@example.com")
+    access_token = jwt_handler.create_access_token("cook@example.com", "ws-1")
+
+    assert jwt_handler.decode_access_token(magic_token) is None
+    assert magic_link.verify_magic_link_token(access_token) is None
+
+
+def test_magic_link_round_trip(auth_settings):
+    """Should verify a magic link token and return the email"""
+    token = magic_link.create_magic_link_token("cook@example.com")
+
+    assert magic_link.verify_magic_link_token(token) == "cook@example.com"
+
+
+def test_missing_secret(auth_settings):
+    """Should refuse to sign and fail closed on verify without a secret"""
+    auth_settings.JWT_SECRET_KEY = ""
+
+    with pytest.raises(ValueError, match="JWT_SECRET_KEY"):
+        jwt_handler.create_access_token("cook@example.com", "ws-1")
+    assert jwt_handler.decode_access_token("a.b.c") is None
+    assert magic_link.verify_magic_link_token("a.b.c") is None
+
+
+def test_magic_link_email_templates_render_url():
+    """Should substitute the link URL into both email bodies"""
+    url = "https://app.example.com/auth/verify?token=abc$def"
+
+    html = magic_link._HTML_TEMPLATE.substitute(url=url)
+    text = magic_link._TEXT_TEMPLATE.substitute(url=url)
+
+    assert f'href="{url}"' in html
+    assert url in text
+    assert f"{magic_link.MAGIC_LINK_EXPIRATION_MINUTES} minutes" in html
+    assert f"{magic_link.MAGIC_LINK_EXPIRATION_MINUTES} minutes" in text
+
+
+@pytest.mark.asyncio
+async def test_send_magic_link_email_without_api_key(auth_settings):
+    """Should report the email service as unconfigured"""
+    success, error = await magic_link.send_magic_link_email("cook@example.com", "https://x/verify")
+
+    assert success is False
+    assert error == "Email service not configured"
+
+
+@pytest.mark.asyncio
+async def test_send_magic_link_email_posts_to_resend(auth_settings, monkeypatch):
+    """Should POST a single email to Resend with the rendered bodies"""
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200, json={"id": "email-1"})
+
+    monkeypatch.setattr(magic_link, "_new_resend_client", lambda api_key: httpx.AsyncClient(
+        base_url=magic_link.RESEND_API_URL, transport=httpx.MockTransport(handler)
+    ))
+    auth_settings.RESEND_API_KEY = "re_test"
+
+    success, error = await magic_link.send_magic_link_email("cook@example.com", "https://x/verify")
+
+    assert (success, error) == (True, None)
+    assert len(sent) == 1
+    assert sent[0].url.path == "/emails"
+    body = json.loads(sent[0].content)
+    assert body["to"] == ["cook@example.com"]
+    assert "https://x/verify" in body["html"]
+
+
+@pytest.mark.asyncio
+async def test_send_magic_link_emails_batch_chunks_recipients(auth_settings, monkeypatch):
+    """Should send one batch request per chunk and keep per-recipient order"""
+    batches = []
+
+    def handler(request):
+        batches.append(json.loads(request.content))
+        if len(batches) == 2:
+            return httpx.Response(429, json={"message": "rate limited"})
+        return httpx.Response(200, json={"data": [{"id": "x"}]})
+
+    monkeypatch.setattr(magic_link, "_new_resend_client", lambda api_key: httpx.AsyncClient(
+        base_url=magic_link.RESEND_API_URL, transport=httpx.MockTransport(handler)
+    ))
+    monkeypatch.setattr(magic_link, "RESEND_BATCH_SIZE", 2)
+    monkeypatch.setattr(magic_link, "RESEND_REQUESTS_PER_SECOND", 1000)
+    auth_settings.RESEND_API_KEY = "re_test"
+
+    recipients = [(f"cook{i}@example.com", f"https://x/verify?t={i}") for i in range(5)]
+    results = await magic_link.send_magic_link_emails_batch(recipients)
+
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert batches[2][0]["to"] == ["cook4@example.com"]
+    assert [ok for ok, _ in results] == [True, True, False, False, True]
+
+
+def test_send_magic_link_email_on_separate_event_loops(auth_settings, monkeypatch):
+    """Should send from each new event loop with its own client, closed afterwards"""
+    clients = []
+
+    def new_client(api_key):
+        clients.append(httpx.AsyncClient(
+            base_url=magic_link.RESEND_API_URL,
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "email-1"}))
+        ))
+        return clients[-1]
+
+    monkeypatch.setattr(magic_link, "_new_resend_client", new_client)
+    auth_settings.RESEND_API_KEY = "re_test"
+
+    for _ in range(2):
+        result = asyncio.run(magic_link.send_magic_link_email("cook@example.com", "https://x/verify"))
+        assert result == (True, None)
+
+    assert len(clients) == 2
+    assert all(client.is_closed for client in clients)
+
+
+def test_resend_client_is_pooled_for_the_app_lifespan(auth_settings):
+    """Should share one client between open_resend_client and close_resend_client"""
+    auth_settings.RESEND_API_KEY = "re_test"
+
+    async def lifespan():
+        await magic_link.open_resend_client()
+        client = magic_link._resend_client
+        async with magic_link._resend_session("re_test") as session_client:
+            assert session_client is client
+        await magic_link.close_resend_client()
+        return client
+
+    client = asyncio.run(lifespan())
+
+    assert client.is_closed
+    assert magic_link._resend_client is None
@@ -0,0 +1,297 @@
+"""Tests for the Chroma recipe embedding manager"""
+import os
+from unittest.mock import patch
+
+import pytest
+
+chromadb = pytest.importorskip("chromadb")
+from chromadb.api.types import EmbeddingFunction
+
+from app.data import chroma_manager
+from app.models.recipe import Recipe
+
+
+class FakeEmbeddingFunction(EmbeddingFunction):
+    """Deterministic bag-of-words embedding so tests never load a real model"""
+
+    VOCAB = ["chicken", "rice", "pasta", "tomato", "salmon", "broccoli", "quick", "oven"]
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, input):
+        self.calls.append(len(input))
+        return [
+            [float(text.lower().count(word)) + 0.01 for word in self.VOCAB]
+            for text in input
+        ]
+
+    @staticmethod
+    def name():
+        return "fake"
+
+    def get_config(self):
+        return {}
+
+    @staticmethod
+    def build_from_config(config):
+        return FakeEmbeddingFunction()
+
+
+@pytest.fixture(autouse=True)
+def performance_env():
+    """Clear the variables configure_performance_environment sets, and
+    restore the whole environment afterwards. monkeypatch.delenv records
+    nothing for an unset variable, so it would not undo a later setdefault."""
+    with patch.dict(os.environ):
+        for name in ("OMP_NUM_THREADS", "TOKENIZERS_PARALLELISM", "ANONYMIZED_TELEMETRY"):
+            os.environ.pop(name, None)
+        yield
+
+
+@pytest.fixture
+def chroma(tmp_path, monkeypatch):
+    """Isolated on-disk Chroma client with a fake embedding function"""
+    fake_ef = FakeEmbeddingFunction()
+    client = chromadb.PersistentClient(path=str(tmp_path / "chroma"))
+    monkeypatch.setattr(chroma_manager, "_chroma_client", client)
+    monkeypatch.setattr(chroma_manager, "_workspace_collections", {})
+    monkeypatch.setattr(chroma_manager, "get_embedding_function", lambda: fake_ef)
+    chroma_manager._embed_query.cache_clear()
+    yield fake_ef
+    chroma_manager._embed_query.cache_clear()
+
+
+def make_recipe(recipe_id, title, tags=None, ingredients=None):
+    return Recipe(
+        id=recipe_id,
+        title=title,
+        ingredients=ingredients or ["chicken breast", "rice"],
+        instructions="Cook everything together",
+        tags=tags or ["dinner", "quick"],
+        prep_time_minutes=10,
+        active_cooking_time_minutes=20,
+        serves=4,
+        required_appliances=["oven"]
+    )
+
+
+def test_embed_and_query_round_trip(chroma):
+    """Should return embedded recipes with their metadata decoded"""
+    chroma_manager.embed_recipes("ws1", [
+        make_recipe("r1", "Chicken and Rice"),
+        make_recipe("r2", "Tomato Pasta", tags=["vegetarian"], ingredients=["pasta", "tomato"]),
+    ])
+
+    results = chroma_manager.query_recipes("ws1", "pasta with tomato", n_results=2)
+
+    assert [r["id"] for r in results] == ["r2", "r1"]
+    assert results[0]["tags"] == ["vegetarian"]
+    assert results[1]["required_appliances"] == ["oven"]
+    assert results[0]["distance"] <= results[1]["distance"]
+
+
+def test_query_is_scoped_to_workspace(chroma):
+    """Should never return recipes from another workspace"""
+    chroma_manager.embed_recipes("ws1", [make_recipe("r1", "Chicken and Rice")])
+    chroma_manager.embed_recipes("ws2", [make_recipe("r1", "Salmon and Broccoli")])
+
+    results = chroma_manager.query_recipes("ws1", "salmon", n_results=5)
+
+    assert [r["title"] for r in results] == ["Chicken and Rice"]
+    assert chroma_manager.get_recipe_count("ws1") == 1
+    assert chroma_manager.get_recipe_count() == 2
+
+
+def test_embed_recipes_batches_adds(chroma, monkeypatch):
+    """Should embed large inputs in EMBED_BATCH_SIZE chunks"""
+    monkeypatch.setattr(chroma_manager, "EMBED_BATCH_SIZE", 2)
+    recipes = [make_recipe(f"r{i}", f"Recipe {i}") for i in range(5)]
+
+    assert chroma_manager.embed_recipes("ws1", recipes) == 5
+    assert chroma.calls == [2, 2, 1]
+    assert chroma_manager.get_recipe_count("ws1") == 5
+
+
+def test_delete_workspace_from_chroma(chroma):
+    """Should remove only the target workspace's entries"""
+    chroma_manager.embed_recipes("ws1", [make_recipe("r1", "A"), make_recipe("r2", "B")])
+    chroma_manager.embed_recipes("ws2", [make_recipe("r1", "C")])
+
+    assert chroma_manager.delete_workspace_from_chroma("ws1") == 2
+    assert chroma_manager.delete_workspace_from_chroma("ws3") == 0
+    assert chroma_manager.get_recipe_count("ws1") == 0
+    assert chroma_manager.get_recipe_count("ws2") == 1
+
+
+def test_sync_chroma_with_storage(chroma, monkeypatch):
+    """Should drop orphaned embeddings and add missing ones"""
+    from app.data import data_manager
+
+    stored = [make_recipe("r1", "Chicken and Rice"), make_recipe("r3", "Tomato Pasta")]
+    monkeypatch.setattr(data_manager, "list_all_recipes", lambda workspace_id: stored)
+    chroma_manager.embed_recipes("ws1", [make_recipe("r1", "Chicken and Rice"), make_recipe("r2", "Old")])
+
+    stats = chroma_manager.sync_chroma_with_storage("ws1")
+
+    assert stats == {"orphaned_removed": 1, "missing_added": 1, "total_in_sync": 2}
+    remaining = chroma_manager.get_recipes_collection("ws1").get(include=[])
+    assert sorted(remaining["ids"]) == ["r1", "r3"]
+
+
+def test_collection_handle_is_cached(chroma):
+    """Should reuse each workspace's collection handle until it is reset"""
+    first = chroma_manager.get_recipes_collection("ws1")
+    assert chroma_manager.get_recipes_collection("ws1") is first
+    assert chroma_manager.get_recipes_collection("ws2") is not first
+
+    chroma_manager.embed_recipes("ws1", [make_recipe("r1", "A")])
+    chroma_manager.embed_recipes("ws2", [make_recipe("r1", "B")])
+    chroma_manager.reset_collection("ws1")
+
+    assert chroma_manager.get_recipes_collection("ws1") is not first
+    assert chroma_manager.get_recipe_count() == 1
+
+    chroma_manager.reset_collection()
+    assert chroma_manager.get_recipe_count() == 0
+
+
+def test_list_metadata_round_trips_and_filters(chroma):
+    """Should store tags as lists and filter on them natively"""
+    chroma_manager.embed_recipes("ws1", [
+        make_recipe("r1", "Chicken and Rice", tags=["sweet, sour", "quick"]),
+        make_recipe("r2", "Tomato Pasta", tags=["toddler-friendly"], ingredients=["pasta", "tomato"]),
+    ])
+
+    results = chroma_manager.query_recipes("ws1", "chicken", n_results=2)
+    toddler = chroma_manager.query_recipes("ws1", "chicken", filters={"tags": {"$contains": "toddler-friendly"}})
+
+    assert results[0]["tags"] == ["sweet, sour", "quick"]
+    assert [r["id"] for r in toddler] == ["r2"]
+
+
+def test_migrate_legacy_collection(chroma):
+    """Should move legacy entries into per-workspace collections and drop the old one"""
+    client = chroma_manager.initialize_chroma()
+    legacy = client.create_collection(name=chroma_manager.LEGACY_RECIPES_COLLECTION_NAME, embedding_function=chroma)
+    legacy.add(
+        ids=["ws1:r1", "ws2:r2"],
+        documents=["Chicken and Rice", "Tomato Pasta"],
+        embeddings=[[1.0] * 8, [0.5] * 8],
+        metadatas=[
+            {"workspace_id": "ws1", "title": "Chicken and Rice", "tags": '["dinner", "quick"]', "required_appliances": ""},
+            {"workspace_id": "ws2", "title": "Tomato Pasta", "tags": "lunch,toddler"},
+        ],
+    )
+
+    assert chroma_manager.migrate_legacy_collection(client) == 2
+
+    ws1 = chroma_manager.get_recipes_collection("ws1").get(include=["metadatas", "embeddings"])
+    ws2 = chroma_manager.get_recipes_collection("ws2").get(include=["metadatas"])
+    assert ws1["ids"] == ["r1"]
+    assert ws1["metadatas"][0] == {"recipe_id": "r1", "title": "Chicken and Rice", "tags": ["dinner", "quick"]}
+    assert list(ws1["embeddings"][0]) == pytest.approx([1.0] * 8)
+    assert ws2["metadatas"][0]["tags"] == ["lunch", "toddler"]
+    assert chroma.calls == []
+    assert chroma_manager.LEGACY_RECIPES_COLLECTION_NAME not in [c.name for c in client.list_collections()]
+    assert chroma_manager.migrate_legacy_collection(client) == 0
+
+
+def test_migrate_legacy_collection_keeps_unassigned_entries(chroma):
+    """Should leave entries without a workspace until one is given"""
+    client = chroma_manager.initialize_chroma()
+    legacy = client.create_collection(name=chroma_manager.LEGACY_RECIPES_COLLECTION_NAME, embedding_function=chroma)
+    legacy.add(ids=["r1"], documents=["Chicken and Rice"], embeddings=[[1.0] * 8], metadatas=[{"title": "Chicken and Rice"}])
+
+    assert chroma_manager.migrate_legacy_collection(client) == 0
+    assert legacy.count() == 1
+
+    assert chroma_manager.migrate_legacy_collection(client, default_workspace_id="andrea") == 1
+    assert chroma_manager.get_recipes_collection("andrea").get()["ids"] == ["r1"]
+    assert chroma_manager.LEGACY_RECIPES_COLLECTION_NAME not in [c.name for c in client.list_collections()]
+
+
+def test_recipe_without_tags_or_appliances(chroma):
+    """Should embed recipes with empty tag/appliance lists"""
+    recipe = make_recipe("r1", "Plain Rice")
+    recipe.tags = []
+    recipe.required_appliances = []
+
+    chroma_manager.embed_recipes("ws1", [recipe])
+    result = chroma_manager.query_recipes("ws1", "rice")[0]
+
+    assert result["tags"] == []
+    assert result["required_appliances"] == []
+
+
+def test_query_embeddings_are_cached(chroma):
+    """Should embed a repeated query text only once"""
+    chroma_manager.embed_recipes("ws1", [make_recipe("r1", "Chicken and Rice")])
+    chroma.calls.clear()
+
+    chroma_manager.query_recipes("ws1", "quick chicken dinner")
+    chroma_manager.query_recipes("ws1", "quick chicken dinner")
+
+    assert chroma.calls == [1]
+
+
+def test_query_with_selective_filter(chroma, monkeypatch):
+    """Should rank only the filter's matches when the filter is narrow"""
+    monkeypatch.setattr(chroma_manager, "SELECTIVE_FILTER_MAX_MATCHES", 2)
+    chroma_manager.embed_recipes("ws1", [
+        make_recipe("r1", "Chicken and Rice"),
+        make_recipe("r2", "Tomato Pasta", tags=["vegetarian"], ingredients=["pasta", "tomato"]),
+        make_recipe("r3", "Salmon Pasta", ingredients=["salmon", "pasta"]),
+        make_recipe("r4", "Pasta Bake", ingredients=["pasta", "tomato"]),
+    ])
+
+    narrow = chroma_manager.query_recipes("ws1", "pasta", filters={"recipe_id": {"$in": ["r1", "r3"]}}, n_results=5)
+    broad = chroma_manager.query_recipes("ws1", "pasta", filters={"serves": 4}, n_results=2)
+    none = chroma_manager.query_recipes("ws1", "pasta", filters={"serves": 99})
+
+    assert [r["id"] for r in narrow] == ["r3", "r1"]
+    assert len(broad) == 2
+    assert none == []
+
+
+def test_delete_recipes_from_chroma(chroma):
+    """Should delete several recipes at once and tolerate unknown IDs"""
+    chroma_manager.embed_recipes("ws1", [make_recipe(f"r{i}", f"Recipe {i}") for i in range(4)])
+
+    chroma_manager.delete_recipes_from_chroma("ws1", ["r0", "r2", "missing"])
+    chroma_manager.delete_recipe_from_chroma("ws1", "r3")
+
+    remaining = chroma_manager.get_recipes_collection("ws1").get(include=[])
+    assert remaining["ids"] == ["r1"]
+
+
+def test_query_by_recipe_ids_uses_id_lookup(chroma):
+    """Should resolve recipe_id filters by ID, scoped to the workspace"""
+    chroma_manager.embed_recipes("ws1", [make_recipe("r1", "Chicken and Rice"), make_recipe("r2", "Tomato Pasta")])
+    chroma_manager.embed_recipes("ws2", [make_recipe("r3", "Salmon Pasta")])
+
+    results = chroma_manager.query_recipes("ws1", "pasta", filters={"recipe_id": {"$in": ["r2", "r3", "missing"]}})
+    single = chroma_manager.query_recipes("ws1", "pasta", filters={"recipe_id": "r1"})
+
+    assert [r["id"] for r in results] == ["r2"]
+    assert [r["id"] for r in single] == ["r1"]
+    assert chroma_manager._recipe_ids_for_filter({"serves": 4}) is None
+
+
+def test_warmup_loads_client_and_model(chroma):
+    """Should embed a warmup query so the model is loaded before traffic"""
+    chroma_manager.warmup()
+
+    assert chroma.calls == [1]
+    assert chroma_manager._embed_query.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize("web_concurrency", ["", "auto", "0"])
+def test_configure_performance_environment_tolerates_bad_worker_count(monkeypatch, web_concurrency):
+    """Should fall back to one worker when WEB_CONCURRENCY is empty or invalid"""
+    monkeypatch.setenv("WEB_CONCURRENCY", web_concurrency)
+    monkeypatch.setattr(chroma_manager.os, "cpu_count", lambda: 4)
+
+    chroma_manager.configure_performance_environment()
+
+    assert os.environ["OMP_NUM_THREADS"] == "4"
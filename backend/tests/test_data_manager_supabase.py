@@ -0,0 +1,143 @@
+"""Tests for Supabase-backed data_manager functions (using the mock_supabase store)"""
+
+
+def add_recipe_row(store, workspace_id, recipe_id, title, meal_types=None, updated_at=None):
+    store["recipes"][recipe_id] = {
+        "id": recipe_id,
+        "workspace_id": workspace_id,
+        "title": title,
+        "ingredients": ["rice"],
+        "instructions": "Cook",
+        "tags": ["dinner"],
+        "prep_time_minutes": 5,
+        "active_cooking_time_minutes": 10,
+        "serves": 2,
+        "required_appliances": [],
+        "meal_types": meal_types or ["dinner"],
+        "updated_at": updated_at,
+        "embedding": [0.1, 0.2],
+    }
+
+
+def test_load_recipes_by_ids_keeps_requested_order(mock_supabase):
+    """Should load recipes in one query, in the caller's order, skipping unknown IDs"""
+    from app.data import data_manager
+
+    add_recipe_row(mock_supabase, "ws1", "r1", "First")
+    add_recipe_row(mock_supabase, "ws1", "r2", "Second")
+    add_recipe_row(mock_supabase, "ws2", "r3", "Other workspace")
+
+    recipes = data_manager.load_recipes_by_ids("ws1", ["r2", "missing", "r3", "r1"])
+
+    assert [r.title for r in recipes] == ["Second", "First"]
+    assert "embedding" not in data_manager.RECIPE_COLUMNS
+    assert data_manager.load_recipes_by_ids("ws1", []) == []
+
+
+def test_load_recipes_by_ids_chunks_long_id_lists(mock_supabase, monkeypatch):
+    """Should split long ID lists across several in_() queries"""
+    from app.data import data_manager
+
+    monkeypatch.setattr(data_manager, "IN_FILTER_CHUNK_SIZE", 2)
+    for i in range(5):
+        add_recipe_row(mock_supabase, "ws1", f"r{i}", f"Recipe {i}")
+    query_class = type(data_manager._get_client().table("recipes").select("*"))
+    in_filters = []
+    original_in = query_class.in_
+    monkeypatch.setattr(query_class, "in_", lambda self, field, values: in_filters.append(values) or original_in(self, field, values))
+
+    recipes = data_manager.load_recipes_by_ids("ws1", ["r4", "r0", "r3", "r0", "r1", "r2"])
+
+    assert [r.id for r in recipes] == ["r4", "r0", "r3", "r0", "r1", "r2"]
+    assert in_filters == [["r4", "r0"], ["r3", "r1"], ["r2"]]
+
+
+def test_list_recipe_summaries(mock_supabase):
+    """Should list the workspace's recipes as plain dicts, most recently updated first"""
+    from app.data import data_manager
+
+    add_recipe_row(mock_supabase, "ws1", "r1", "Older", updated_at="2026-01-01T00:00:00")
+    add_recipe_row(mock_supabase, "ws1", "r2", "Newer", updated_at="2026-02-01T00:00:00")
+    add_recipe_row(mock_supabase, "ws2", "r3", "Other workspace", updated_at="2026-03-01T00:00:00")
+
+    summaries = data_manager.list_recipe_summaries("ws1")
+
+    assert [s["title"] for s in summaries] == ["Newer", "Older"]
+
+
+def test_list_all_recipes_and_load_recipe(mock_supabase):
+    """Should read recipes back without storage-only columns"""
+    from app.data import data_manager
+
+    add_recipe_row(mock_supabase, "ws1", "r1", "Soup", updated_at="2026-01-01T00:00:00")
+
+    assert [r.id for r in data_manager.list_all_recipes("ws1")] == ["r1"]
+    assert data_manager.load_recipe("ws1", "r1").title == "Soup"
+    assert data_manager.load_recipe("ws1", "missing") is None
+
+
+def test_get_workspace_stats(mock_supabase):
+    """Should count rows across tables and report the latest meal plan"""
+    from app.data import data_manager
+
+    for i in range(3):
+        add_recipe_row(mock_supabase, "ws1", f"r{i}", f"Recipe {i}")
+    add_recipe_row(mock_supabase, "ws2", "r9", "Other")
+    for plan_id, created_at in (("p1", "2024-01-01T00:00:00"), ("p2", "2024-02-01T00:00:00")):
+        mock_supabase["meal_plans"][plan_id] = {"id": plan_id, "workspace_id": "ws1", "created_at": created_at}
+    mock_supabase["groceries"]["ws1"] = {"workspace_id": "ws1", "items": [{"name": "milk"}, {"name": "eggs"}]}
+
+    stats = data_manager.get_workspace_stats("ws1")
+
+    assert stats["recipe_count"] == 3
+    assert stats["meal_plan_count"] == 2
+    assert stats["last_meal_plan_date"] == "2024-02-01T00:00:00"
+    assert stats["grocery_count"] == 2
+    assert stats["member_count"] == 0
+    assert data_manager.is_workspace_empty("ws3") is True
+
+
+def test_list_workspaces_merges_tables(mock_supabase):
+    """Should list each workspace once, whichever tables it has rows in"""
+    from app.data import data_manager
+
+    mock_supabase["profiles"]["u1"] = {"id": "u1", "workspace_id": "ws-b"}
+    mock_supabase["household_profiles"]["ws-a"] = {"workspace_id": "ws-a"}
+    add_recipe_row(mock_supabase, "ws-b", "r1", "Soup")
+    add_recipe_row(mock_supabase, "ws-c", "r2", "Stew")
+
+    assert data_manager.list_workspaces() == ["ws-a", "ws-b", "ws-c"]
+
+
+def test_groceries_round_trip(mock_supabase):
+    """Should store grocery items as JSON-ready dicts and load them back"""
+    from datetime import date
+
+    from app.data import data_manager
+    from app.models.grocery import GroceryItem
+
+    items = [
+        GroceryItem(name="milk", expiry_type="expiry_date", expiry_date=date(2024, 3, 1)),
+        GroceryItem(name="rice", storage_location="pantry"),
+    ]
+    data_manager.save_groceries("ws1", items)
+
+    stored = mock_supabase["groceries"]["ws1"]["items"]
+    assert stored == [item.model_dump(mode="json") for item in items]
+    assert stored[0]["expiry_date"] == "2024-03-01"
+    assert data_manager.load_groceries("ws1") == items
+    assert data_manager.load_groceries("ws2") == []
+
+
+def test_is_workspace_empty(mock_supabase):
+    """Should treat a workspace as empty only when no source has data"""
+    from app.data import data_manager
+
+    mock_supabase["groceries"]["ws-empty"] = {"workspace_id": "ws-empty", "items": []}
+    mock_supabase["household_profiles"]["ws-empty"] = {"workspace_id": "ws-empty", "family_members": []}
+    mock_supabase["meal_plans"]["p1"] = {"id": "p1", "workspace_id": "ws-plans"}
+    mock_supabase["household_profiles"]["ws-family"] = {"workspace_id": "ws-family", "family_members": [{"name": "Sam"}]}
+
+    assert data_manager.is_workspace_empty("ws-empty") is True
+    assert data_manager.is_workspace_empty("ws-plans") is False
+    assert data_manager.is_workspace_empty("ws-family") is False
@@ -0,0 +1,236 @@
+"""Tests for the JSON-file-backed stores and logs"""
+import json
+
+import pytest
+
+from app.config import settings
+from app.data import invite_manager, user_manager
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point the file stores at an empty temporary DATA_DIR"""
+    monkeypatch.setattr(settings, "DATA_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_invite_round_trip(data_dir):
+    """Should persist an invite and record its redemption"""
+    created = invite_manager.create_invite(code="beta-1", max_uses=2, expires_in_days=7)
+
+    loaded = invite_manager.get_invite("BETA-1")
+    success, _ = invite_manager.validate_and_use_invite("beta-1", "cook@example.com")
+
+    assert loaded == created
+    assert success is True
+    assert invite_manager.get_invite("BETA-1").uses == 1
+    assert [r.email for r in invite_manager.get_redemptions_for_code("BETA-1")] == ["cook@example.com"]
+
+
+def test_unreadable_invites_file_is_treated_as_empty(data_dir):
+    """Should not fail when the invites file is corrupt"""
+    (data_dir / "invites.json").write_text("{not json")
+
+    assert invite_manager.list_invites() == []
+
+
+def test_user_round_trip(data_dir):
+    """Should create a user once and load it back by email"""
+    created = user_manager.get_or_create_user("Cook.Name@example.com")
+
+    assert user_manager.get_or_create_user("Cook.Name@example.com") == created
+    assert created.workspace_id == "cook-name"
+    assert user_manager.get_user_by_email("missing@example.com") is None
+
+
+def test_acknowledged_errors_round_trip(tmp_path, monkeypatch):
+    """Should persist error acknowledgements per workspace"""
+    from app.middleware import request_logger
+
+    monkeypatch.setattr(request_logger, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(request_logger, "ACKNOWLEDGED_ERRORS_FILE", tmp_path / "acknowledged_errors.json")
+
+    record = request_logger.clear_errors_for_workspace("ws-1")
+
+    assert request_logger._load_acknowledged_errors() == {"ws-1": record}
+
+
+def test_append_json_line_creates_missing_directory(tmp_path):
+    """Should create the log directory on first append and add one line per entry"""
+    from app.data.json_files import append_json_line
+
+    log_file = tmp_path / "logs" / "requests.jsonl"
+    append_json_line(log_file, {"path": "/recipes", "status_code": 200})
+    append_json_line(log_file, {"path": "/health", "status_code": 200})
+
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1]) == {"path": "/health", "status_code": 200}
+
+
+def test_request_log_readers_skip_bad_lines(tmp_path, monkeypatch):
+    """Should read the request log newest first, ignoring blank and corrupt lines"""
+    from app.middleware import request_logger
+
+    log_file = tmp_path / "request_log.jsonl"
+    log_file.write_text(
+        '{"workspace_id": "ws-1", "path": "/a", "timestamp": "1"}\n'
+        "\n"
+        "{not json\n"
+        '{"workspace_id": "ws-1", "path": "/b", "timestamp": "2", "error": "boom"}\n'
+    )
+    monkeypatch.setattr(request_logger, "REQUEST_LOG_FILE", log_file)
+    monkeypatch.setattr(request_logger, "ACKNOWLEDGED_ERRORS_FILE", tmp_path / "acknowledged_errors.json")
+
+    assert [e["path"] for e in request_logger.get_recent_requests()] == ["/b", "/a"]
+    assert [e["path"] for e in request_logger.get_errors_for_workspace("ws-1")] == ["/b"]
+    stats = request_logger.get_workspace_request_stats("ws-1")
+    assert (stats["total_requests"], stats["error_count"], stats["last_request"]) == (2, 1, "2")
+
+
+def test_reads_do_not_create_directories(tmp_path, monkeypatch):
+    """Should leave the filesystem untouched when only reading"""
+    data_dir = tmp_path / "missing"
+    monkeypatch.setattr(settings, "DATA_DIR", str(data_dir))
+
+    assert invite_manager.get_invite("NOPE") is None
+    assert user_manager.get_user_by_email("cook@example.com") is None
+    assert not data_dir.exists()
+
+    user_manager.create_user("cook@example.com")
+    assert (data_dir / "users").is_dir()
+
+
+def test_write_json_replaces_file_atomically(tmp_path, monkeypatch):
+    """Should keep the previous contents if writing the new ones fails"""
+    from app.data import json_files
+
+    target = tmp_path / "invites.json"
+    json_files.write_json(target, {"A": 1})
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json_files.os, "replace", fail)
+    with pytest.raises(OSError):
+        json_files.write_json(target, {"B": 2})
+    monkeypatch.undo()
+
+    assert json_files.read_json(target) == {"A": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["invites.json"]
+
+
+def test_write_json_concurrent_writers(tmp_path):
+    """Should never leave a torn file or stray temp files when threads write at once"""
+    import threading
+    from app.data import json_files
+
+    target = tmp_path / "invites.json"
+    errors = []
+
+    def writer(n):
+        try:
+            for i in range(200):
+                json_files.write_json(target, {"writer": n, "i": i})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert json_files.read_json(target)["i"] == 199
+    assert [p.name for p in tmp_path.iterdir()] == ["invites.json"]
+
+
+def test_write_json_keeps_file_mode(tmp_path):
+    """Should keep an existing file's permissions and give new files the umask default"""
+    import os
+    from app.data import json_files
+
+    existing = tmp_path / "invites.json"
+    existing.write_text("{}")
+    existing.chmod(0o640)
+    json_files.write_json(existing, {"A": 1})
+
+    umask = os.umask(0o022)
+    try:
+        json_files.write_json(tmp_path / "new.json", {"B": 2})
+    finally:
+        os.umask(umask)
+
+    assert existing.stat().st_mode & 0o777 == 0o640
+    assert (tmp_path / "new.json").stat().st_mode & 0o777 == 0o644
+
+
+def test_write_json_compact_option(tmp_path):
+    """Should only indent when asked to"""
+    from app.data.json_files import write_json
+
+    write_json(tmp_path / "pretty.json", {"a": [1, 2]})
+    write_json(tmp_path / "compact.json", {"a": [1, 2]}, indent=False)
+
+    assert "\n" in (tmp_path / "pretty.json").read_text()
+    assert (tmp_path / "compact.json").read_text() == '{"a":[1,2]}'
+
+
+def test_redemptions_migrate_from_legacy_json_array(data_dir):
+    """Should fold the old JSON array file into the JSONL log and keep appending"""
+    (data_dir / "invite_redemptions.json").write_text(
+        '[{"code": "BETA-1", "email": "old@example.com", "redeemed_at": "2026-01-01T00:00:00+00:00"}]'
+    )
+    invite_manager.create_invite(code="BETA-1")
+
+    invite_manager.validate_and_use_invite("BETA-1", "new@example.com")
+
+    emails = [r.email for r in invite_manager.get_redemptions_for_code("BETA-1")]
+    assert emails == ["old@example.com", "new@example.com"]
+    assert (data_dir / "invite_redemptions.json").exists()
+    assert len((data_dir / "invite_redemptions.jsonl").read_text().splitlines()) == 2
+
+
+def test_redemptions_migration_skips_already_migrated_entries(data_dir):
+    """Should not duplicate redemptions already copied by a previous migration"""
+    entry = '{"code": "BETA-1", "email": "old@example.com", "redeemed_at": "2026-01-01T00:00:00+00:00"}'
+    (data_dir / "invite_redemptions.json").write_text(f"[{entry}]")
+    (data_dir / "invite_redemptions.jsonl").write_text(entry + "\n")
+
+    emails = [r.email for r in invite_manager.get_redemptions_for_code("BETA-1")]
+    emails += [r.email for r in invite_manager.get_redemptions_for_code("BETA-1")]
+
+    assert emails == ["old@example.com", "old@example.com"]
+    assert len((data_dir / "invite_redemptions.jsonl").read_text().splitlines()) == 1
+
+
+def test_redemptions_legacy_check_runs_once(data_dir):
+    """Should only look for the legacy file on the first load"""
+    invite_manager._load_redemptions()
+    (data_dir / "invite_redemptions.json").write_text(
+        '[{"code": "BETA-1", "email": "old@example.com", "redeemed_at": "2026-01-01T00:00:00+00:00"}]'
+    )
+
+    assert invite_manager._load_redemptions() == []
+
+
+def test_redemptions_skip_torn_line(data_dir):
+    """Should keep earlier redemptions readable if the last append was cut short"""
+    (data_dir / "invite_redemptions.jsonl").write_text(
+        '{"code": "BETA-1", "email": "a@example.com", "redeemed_at": "2026-01-01T00:00:00+00:00"}\n{"code": "BE'
+    )
+
+    emails = [r.email for r in invite_manager.get_redemptions_for_code("BETA-1")]
+
+    assert emails == ["a@example.com"]
+
+
+@pytest.mark.parametrize("email,workspace_id", [
+    ("Cook.Name@example.com", "cook-name"),
+    ("a--b__c@example.com", "a-b-c"),
+    ("-.-@example.com", "user"),
+])
+def test_email_to_workspace_id(email, workspace_id):
+    """Should collapse non-alphanumeric runs into single hyphens"""
+    assert user_manager._email_to_workspace_id(email) == workspace_id
@@ -0,0 +1,19 @@
+"""Tests for parsing Claude's meal plan JSON into a MealPlan"""
+from app.services.claude_service import _parse_meal_plan_response
+from tests.test_meal_plan_persistence import create_test_meal_plan
+
+
+def test_parse_meal_plan_response_from_code_block():
+    """Should parse a meal plan wrapped in a markdown JSON block"""
+    meal_plan = create_test_meal_plan()
+    response_text = f"Here is your plan:\n```json\n{meal_plan.model_dump_json()}\n```"
+
+    parsed = _parse_meal_plan_response(response_text, "2025-01-06")
+
+    assert parsed == meal_plan
+
+
+def test_parse_meal_plan_response_rejects_bad_json_and_invalid_plans():
+    """Should return None for malformed JSON or a plan that fails validation"""
+    assert _parse_meal_plan_response("{not json", "2025-01-06") is None
+    assert _parse_meal_plan_response('{"week_start_date": "2025-01-06", "days": []}', "2025-01-06") is None
@@ -2,10 +2,14 @@
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock, MagicMock
-from app.main import app
 from app.models.recipe import Recipe
 
-client = TestClient(app)
+
+@pytest.fixture
+def client():
+    """Test client built per test, so log paths patched by conftest apply"""
+    from app.main import app
+    return TestClient(app)
 
 
 @pytest.fixture
@@ -38,7 +42,7 @@ def mock_successful_import():
         yield mock_fetch, mock_parse
 
 
-def test_import_from_url_success(mock_successful_import):
+def test_import_from_url_success(client, mock_successful_import):
     """Should return parsed recipe data with high confidence"""
     response = client.post(
         "/recipes/import-from-url?workspace_id=test",
@@ -71,7 +75,7 @@ def test_import_from_url_success(mock_successful_import):
     assert recipe_data["source_name"] == "Allrecipes"
 
 
-def test_import_from_url_invalid_url():
+def test_import_from_url_invalid_url(client):
     """Should return 400 for invalid URL format"""
     response = client.post(
         "/recipes/import-from-url?workspace_id=test",
@@ -83,7 +87,7 @@ def test_import_from_url_invalid_url():
     assert "invalid" in response.json()["detail"].lower() or "url" in response.json()["detail"].lower()
 
 
-def test_import_from_url_fetch_failure():
+def test_import_from_url_fetch_failure(client):
     """Should return 503 for URL fetch failures"""
     with patch('app.routers.recipes.fetch_html_from_url') as mock_fetch:
         # Mock timeout error
@@ -101,7 +105,7 @@ def test_import_from_url_fetch_failure():
         assert "detail" in response.json()
 
 
-def test_import_from_url_404_error():
+def test_import_from_url_404_error(client):
     """Should return 503 for 404 errors"""
     with patch('app.routers.recipes.fetch_html_from_url') as mock_fetch:
         # Mock 404 error
@@ -120,7 +124,7 @@ def test_import_from_url_404_error():
         assert response.status_code == 503
 
 
-def test_import_from_url_parse_failure():
+def test_import_from_url_parse_failure(client):
     """Should return 400 for parsing failures"""
     with patch('app.routers.recipes.fetch_html_from_url') as mock_fetch, \
          patch('app.routers.recipes.parse_recipe_from_url') as mock_parse:
@@ -144,7 +148,7 @@ def test_import_from_url_parse_failure():
         assert "detail" in response.json()
 
 
-def test_import_from_url_missing_workspace_id():
+def test_import_from_url_missing_workspace_id(client):
     """Should require workspace_id query parameter"""
     response = client.post(
         "/recipes/import-from-url",
@@ -154,7 +158,7 @@ def test_import_from_url_missing_workspace_id():
     assert response.status_code == 422  # FastAPI validation error
 
 
-def test_import_from_url_missing_url_in_body():
+def test_import_from_url_missing_url_in_body(client):
     """Should require url in request body"""
     response = client.post(
         "/recipes/import-from-url?workspace_id=test",
@@ -164,7 +168,7 @@ def test_import_from_url_missing_url_in_body():
     assert response.status_code == 422  # FastAPI validation error
 
 
-def test_import_does_not_save_recipe():
+def test_import_does_not_save_recipe(client):
     """Should NOT save recipe to database (only return data for user review)"""
     with patch('app.routers.recipes.fetch_html_from_url') as mock_fetch, \
          patch('app.routers.recipes.parse_recipe_from_url') as mock_parse, \
@@ -200,7 +204,7 @@ def test_import_does_not_save_recipe():
         assert mock_save.call_count == 0
 
 
-def test_import_with_partial_data():
+def test_import_with_partial_data(client):
     """Should handle partial recipe data with warnings"""
     with patch('app.routers.recipes.fetch_html_from_url') as mock_fetch, \
          patch('app.routers.recipes.parse_recipe_from_url') as mock_parse:
@@ -236,7 +240,7 @@ def test_import_with_partial_data():
         assert "Incomplete data" in data["warnings"]
 
 
-def test_import_sets_source_fields():
+def test_import_sets_source_fields(client):
     """Should set source_url and source_name from URL and domain"""
     with patch('app.routers.recipes.fetch_html_from_url') as mock_fetch, \
          patch('app.routers.recipes.parse_recipe_from_url') as mock_parse:
@@ -270,7 +274,7 @@ def test_import_sets_source_fields():
         assert recipe_data["source_name"] == "FoodNetwork"
 
 
-def test_import_workspace_validation():
+def test_import_workspace_validation(client):
     """Should validate workspace_id format"""
     response = client.post(
         "/recipes/import-from-url?workspace_id=../etc/passwd",